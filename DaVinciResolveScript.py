@@ -2,24 +2,8 @@ import sys
 import os
 import logging 
 
-def load_dynamic(module_name, file_path):
-    if sys.version_info[0] >= 3 and sys.version_info[1] >= 5:
-        import importlib.machinery
-        import importlib.util
-
-        module = None
-        spec = None
-        loader = importlib.machinery.ExtensionFileLoader(module_name, file_path)
-        if loader:
-            spec = importlib.util.spec_from_loader(module_name, loader)
-        if spec:
-            module = importlib.util.module_from_spec(spec)
-        if module:
-            loader.exec_module(module)
-        return module
-    else:
-        import imp
-        return imp.load_dynamic(module_name, file_path)
+# Share the single dynamic-loader implementation with the application's loader
+from resolve_loader import load_dynamic
 
 script_module = None
 try:
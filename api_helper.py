@@ -1,116 +1,187 @@
 import logging
 import os
 import platform
+from collections import namedtuple
+
+ResolveContext = namedtuple("ResolveContext", ["project_manager", "project", "timeline", "media_pool"])
+
+# (availability key, owning API object, method name, helper attribute) probed at connect time
+_METHOD_TABLE = (
+    ("timeline.AddTransition", "timeline", "AddTransition", "has_add_transition"),
+    ("timeline.RemoveItem", "timeline", "RemoveItem", "has_remove_item"),
+    ("timeline.DeleteClips", "timeline", "DeleteClips", "has_delete_clips"),
+    ("timeline.GetItemListInTrack", "timeline", "GetItemListInTrack", "has_get_item_list_in_track"),
+    ("timeline.InsertFusionTitleIntoTimeline", "timeline", "InsertFusionTitleIntoTimeline", "has_fusion_title"),
+    ("timeline.InsertFusionGeneratorIntoTimeline", "timeline", "InsertFusionGeneratorIntoTimeline", "has_fusion_generator"),
+    ("timeline.CreateSubtitlesFromAudio", "timeline", "CreateSubtitlesFromAudio", "has_subtitles_from_audio"),
+    ("mediaPool.DuplicateMediaPoolItem", "mediaPool", "DuplicateMediaPoolItem", "has_duplicate_media_pool_item"),
+    ("mediaPool.AppendToTimeline", "mediaPool", "AppendToTimeline", "has_append_to_timeline"),
+    ("mediaPool.TranscribeAudio", "mediaPool", "TranscribeAudio", "has_transcribe_audio"),
+)
+_ATTR_BY_KEY = {key: attr for key, _, _, attr in _METHOD_TABLE}
+
+class Capabilities:
+    """Snapshot of the API methods ResolveController branches on, read as plain booleans."""
+    __slots__ = ("remove_item", "delete_clips", "add_transition", "append_timeline", "item_list")
+
+    def __init__(self, helper=None):
+        # Timeline methods are unknown until a timeline has actually been probed
+        timeline_known = helper is not None and helper.is_probed("timeline")
+        self.remove_item = timeline_known and bool(helper.has_remove_item)
+        self.delete_clips = timeline_known and bool(helper.has_delete_clips)
+        self.add_transition = timeline_known and bool(helper.has_add_transition)
+        self.append_timeline = bool(helper and helper.has_append_to_timeline)
+        # Until then, assume the current GetItemListInTrack API
+        self.item_list = not timeline_known or bool(helper.has_get_item_list_in_track)
 
 class ResolveAPIHelper:
     """Helper class to manage DaVinci Resolve API version compatibility."""
     
     def __init__(self, resolve):
         self.resolve = resolve
+        self._ctx = self._fetch_context()
         self.api_version = self._get_api_version()
-        logging.info(f"DaVinci Resolve API Version: {self.api_version}")
-        self.available_methods = self._detect_available_methods()
+        logging.info("DaVinci Resolve API Version: %s", self.api_version)
+        self.available_methods = {}
+        # API objects ("timeline", "mediaPool") whose methods have been probed; one that didn't
+        # exist at connect time (e.g. no open timeline) is probed later through probe()
+        self._probed_owners = set()
+        self._apply_availability()
+        self.probe(self._ctx.timeline, self._ctx.media_pool)
+
+    def _apply_availability(self):
+        self._supported_methods = frozenset(key for key, ok in self.available_methods.items() if ok)
+        # Flatten availability into plain attributes so hot paths pay a single attribute load
+        for key, attr in _ATTR_BY_KEY.items():
+            setattr(self, attr, self.available_methods.get(key, False))
+        # Pick each safe_* implementation once so per-clip calls don't re-check support
+        self.safe_add_transition = self._add_transition if self.has_add_transition else self._skip_transition
+        self.safe_remove_timeline_item = (
+            self._remove_timeline_item if self.has_remove_item else self._skip_remove_timeline_item
+        )
+
+    def probe(self, timeline=None, media_pool=None):
+        """Probe the methods of any given API object not probed yet; return True if any was."""
+        api_objects = {
+            owner: obj for owner, obj in (("timeline", timeline), ("mediaPool", media_pool))
+            if obj is not None and owner not in self._probed_owners
+        }
+        if not api_objects:
+            return False
+        self.available_methods.update(self._detect_available_methods(api_objects))
+        self._probed_owners.update(api_objects)
+        self._apply_availability()
+        return True
+
+    def is_probed(self, owner):
+        """Return True once the methods of owner ("timeline" or "mediaPool") have been probed."""
+        return owner in self._probed_owners
         
+    def _fetch_context(self):
+        """Fetch the project manager, project, timeline and media pool handles once."""
+        project_manager = project = timeline = media_pool = None
+        try:
+            project_manager = self.resolve.GetProjectManager()
+            project = project_manager.GetCurrentProject() if project_manager else None
+            if project:
+                timeline = project.GetCurrentTimeline()
+                media_pool = project.GetMediaPool()
+        except Exception as e:
+            logging.warning("Error fetching Resolve project context: %s", e)
+        return ResolveContext(project_manager, project, timeline, media_pool)
+
     def _get_api_version(self):
         """Attempt to get the Resolve API version."""
         try:
-            if hasattr(self.resolve, "GetVersionString") and callable(self.resolve.GetVersionString):
+            if callable(getattr(self.resolve, "GetVersionString", None)):
                 return self.resolve.GetVersionString()
             else:
                 # Try alternative methods to determine version
-                project_manager = self.resolve.GetProjectManager()
-                if project_manager:
-                    project = project_manager.GetCurrentProject()
-                    if project:
-                        # Different versions expose different methods
-                        for method in ["GetSetting", "GetPresetList", "GetRenderFormats"]:
-                            if hasattr(project, method):
-                                return f"Unknown (has {method})"
+                project = self._ctx.project
+                if project:
+                    # Different versions expose different methods
+                    for method in ["GetSetting", "GetPresetList", "GetRenderFormats"]:
+                        if hasattr(project, method):
+                            return f"Unknown (has {method})"
                 return "Unknown"
         except Exception as e:
-            logging.warning(f"Failed to determine API version: {e}")
+            logging.warning("Failed to determine API version: %s", e)
             return "Unknown"
     
-    def _detect_available_methods(self):
-        """Detect available methods in the current Resolve API version."""
+    def _detect_available_methods(self, api_objects):
+        """Detect available methods on the given {owner: API object} in the current Resolve API version."""
         available = {}
         
-        # Get current project and timeline
         try:
-            project_manager = self.resolve.GetProjectManager()
-            project = project_manager.GetCurrentProject()
-            timeline = project.GetCurrentTimeline() if project else None
-            media_pool = project.GetMediaPool() if project else None
-            
-            # Check Timeline methods
-            if timeline:
-                available["timeline.AddTransition"] = hasattr(timeline, "AddTransition") and callable(timeline.AddTransition)
-                available["timeline.RemoveItem"] = hasattr(timeline, "RemoveItem") and callable(timeline.RemoveItem)
-                available["timeline.GetItemListInTrack"] = hasattr(timeline, "GetItemListInTrack") and callable(timeline.GetItemListInTrack)
-                available["timeline.InsertFusionTitleIntoTimeline"] = hasattr(timeline, "InsertFusionTitleIntoTimeline") and callable(timeline.InsertFusionTitleIntoTimeline)
-                available["timeline.InsertFusionGeneratorIntoTimeline"] = hasattr(timeline, "InsertFusionGeneratorIntoTimeline") and callable(timeline.InsertFusionGeneratorIntoTimeline)
-                available["timeline.CreateSubtitlesFromAudio"] = hasattr(timeline, "CreateSubtitlesFromAudio") and callable(timeline.CreateSubtitlesFromAudio)
+            # One getattr per entry; callable() of the result replaces hasattr + callable
+            for key, owner, method, _ in _METHOD_TABLE:
+                obj = api_objects.get(owner)
+                if obj is not None:
+                    available[key] = callable(getattr(obj, method, None))
                 
-            # Check MediaPool methods
-            if media_pool:
-                available["mediaPool.DuplicateMediaPoolItem"] = hasattr(media_pool, "DuplicateMediaPoolItem") and callable(media_pool.DuplicateMediaPoolItem)
-                available["mediaPool.AppendToTimeline"] = hasattr(media_pool, "AppendToTimeline") and callable(media_pool.AppendToTimeline)
-                available["mediaPool.TranscribeAudio"] = hasattr(media_pool, "TranscribeAudio") and callable(media_pool.TranscribeAudio)
-                
-            # Log availability
-            for method, available_status in available.items():
-                logging.info(f"API Method {method}: {'Available' if available_status else 'Not Available'}")
+            # Log availability as one record, and only build it when INFO is enabled
+            if available and logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("API method availability:\n%s", "\n".join(
+                    f"  {method}: {'Available' if status else 'Not Available'}"
+                    for method, status in available.items()
+                ))
                 
         except Exception as e:
-            logging.warning(f"Error detecting available methods: {e}")
+            logging.warning("Error detecting available methods: %s", e)
             
         return available
     
     def is_method_available(self, method_name):
         """Check if a specific method is available in the current API version."""
-        return self.available_methods.get(method_name, False)
+        return method_name in self._supported_methods
+
+    def get_supported_methods(self):
+        """Return the frozenset of available method keys, e.g. "timeline.AddTransition"."""
+        return self._supported_methods
     
-    def safe_add_transition(self, timeline, transition_type, clip1, clip2, duration=30):
-        """Safely add a transition between clips if the API supports it."""
-        if self.is_method_available("timeline.AddTransition"):
-            try:
-                result = timeline.AddTransition(transition_type, clip1, clip2, duration)
-                if result:
-                    logging.info(f"Successfully added {transition_type} transition")
-                else:
-                    logging.warning(f"Failed to add {transition_type} transition")
-                return result
-            except Exception as e:
-                logging.exception(f"Error adding transition: {e}")
-                return False
-        else:
-            logging.info("Skipping transition - AddTransition method not available in this API version")
+    def _add_transition(self, timeline, transition_type, clip1, clip2, duration=30):
+        """Add a transition between clips; bound as safe_add_transition when supported."""
+        try:
+            result = timeline.AddTransition(transition_type, clip1, clip2, duration)
+            if result:
+                logging.info("Successfully added %s transition", transition_type)
+            else:
+                logging.warning("Failed to add %s transition", transition_type)
+            return result
+        except Exception as e:
+            logging.exception("Error adding transition: %s", e)
             return False
-    
-    def safe_remove_timeline_item(self, timeline, item):
-        """Safely remove an item from timeline if the API supports it."""
-        if self.is_method_available("timeline.RemoveItem"):
-            try:
-                result = timeline.RemoveItem(item)
-                return result
-            except Exception as e:
-                logging.exception(f"Error removing timeline item: {e}")
-                return False
-        else:
-            logging.info("Skipping item removal - RemoveItem method not available in this API version")
+
+    def _skip_transition(self, timeline, transition_type, clip1, clip2, duration=30):
+        """Stand-in for safe_add_transition when AddTransition is missing."""
+        logging.info("Skipping transition - AddTransition method not available in this API version")
+        return False
+
+    def _remove_timeline_item(self, timeline, item):
+        """Remove an item from the timeline; bound as safe_remove_timeline_item when supported."""
+        try:
+            return timeline.RemoveItem(item)
+        except Exception as e:
+            logging.exception("Error removing timeline item: %s", e)
             return False
+
+    def _skip_remove_timeline_item(self, timeline, item):
+        """Stand-in for safe_remove_timeline_item when RemoveItem is missing."""
+        logging.info("Skipping item removal - RemoveItem method not available in this API version")
+        return False
             
     def get_feature_support_info(self):
         """Return a human-readable summary of API feature support."""
         support_info = {
-            "Transitions": self.is_method_available("timeline.AddTransition"),
-            "Timeline Item Removal": self.is_method_available("timeline.RemoveItem"),
-            "Fusion Titles": self.is_method_available("timeline.InsertFusionTitleIntoTimeline"),
-            "Fusion Generators": self.is_method_available("timeline.InsertFusionGeneratorIntoTimeline"),
-            "Subtitles from Audio": self.is_method_available("timeline.CreateSubtitlesFromAudio"),
-            "Media Duplication": self.is_method_available("mediaPool.DuplicateMediaPoolItem"),
-            "Timeline Appending": self.is_method_available("mediaPool.AppendToTimeline"),
-            "Audio Transcription": self.is_method_available("mediaPool.TranscribeAudio")
+            "Transitions": self.has_add_transition,
+            "Timeline Item Removal": self.has_remove_item,
+            "Batch Clip Deletion": self.has_delete_clips,
+            "Fusion Titles": self.has_fusion_title,
+            "Fusion Generators": self.has_fusion_generator,
+            "Subtitles from Audio": self.has_subtitles_from_audio,
+            "Media Duplication": self.has_duplicate_media_pool_item,
+            "Timeline Appending": self.has_append_to_timeline,
+            "Audio Transcription": self.has_transcribe_audio
         }
         
         return support_info
\ No newline at end of file
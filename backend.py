@@ -1,21 +1,255 @@
 import os
+import sys
 import logging
 import time
+import random
+import threading
+import functools
+import queue
+from collections import OrderedDict, defaultdict
+from itertools import chain
 import platform
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    from itertools import pairwise
+except ImportError:  # Python < 3.10
+    from itertools import tee
+
+    def pairwise(iterable):
+        a, b = tee(iterable)
+        next(b, None)
+        return zip(a, b)
 import api_helper  # Changed from relative import
-from api_helper import ResolveAPIHelper
+from api_helper import ResolveAPIHelper, Capabilities
 
 # Import DaVinciResolveScript using our improved loader
 import resolve_loader  # Changed from relative import
-dvr = resolve_loader.load_resolve_script()
+
+def _get_dvr():
+    """Load the scripting module on first use, so importing backend never touches fusionscript."""
+    # resolve_loader caches a found module; a miss is retried on the next connect
+    return resolve_loader.load_resolve_script()
+
+# Whether a clip item type exposes GetClipProperty, probed once per type
+_HAS_GCP_CACHE = {}
+
+# Default longest wait, in seconds, between Resolve connection attempts
+MAX_CONNECT_BACKOFF = 2.0
+
+# Upper bound on concurrent ApplyLUT calls; set to 1 if the bridge serializes them anyway
+LUT_APPLY_WORKERS = 8
+
+# Most clip names get_clip_name keeps before evicting the least recently used
+CLIP_NAME_CACHE_SIZE = 1024
+
+# Named export resolutions as integer (width, height), the form SetRenderSettings expects
+_RESOLUTION_PRESETS = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "8K": (7680, 4320),
+}
+
+# Prebuilt size settings per named preset, shared across exports instead of rebuilt each time
+_RENDER_SIZE_PRESETS = {
+    name: {"FormatWidth": width, "FormatHeight": height}
+    for name, (width, height) in _RESOLUTION_PRESETS.items()
+}
+
+def _render_size_settings(resolution):
+    """Return FormatWidth/FormatHeight for a named preset or a {"width", "height"} dict."""
+    if isinstance(resolution, dict):
+        return {
+            "FormatWidth": int(resolution.get("width", 1920)),
+            "FormatHeight": int(resolution.get("height", 1080)),
+        }
+    return _RENDER_SIZE_PRESETS.get(resolution, _RENDER_SIZE_PRESETS["1080p"])
+
+# Timecode divisors (fps, frames per minute, frames per hour) precomputed for common frame rates
+_FPS_DEFAULTS = {fps: (fps, fps * 60, fps * 3600) for fps in (24, 25, 30, 50, 60)}
+
+# Searched in order; the first directory containing a LUT wins. Only this OS's locations are listed.
+_USER_LUT_DIR = os.path.expanduser("~/Documents/Blackmagic Design/DaVinci Resolve/LUT")
+if sys.platform == "win32":
+    _LUT_DIRECTORIES = (_USER_LUT_DIR, "C:/ProgramData/Blackmagic Design/DaVinci Resolve/Support/LUT")
+elif sys.platform == "darwin":
+    _LUT_DIRECTORIES = (_USER_LUT_DIR, "/Library/Application Support/Blackmagic Design/DaVinci Resolve/LUT")
+else:
+    _LUT_DIRECTORIES = (_USER_LUT_DIR, "/opt/resolve/LUT")
+
+_LUT_NAMES = {
+    "Default": "Default.cube",
+    "Cinematic": "Film Look.cube",
+    "Vintage": "Vintage Film.cube",
+}
+
+@functools.lru_cache(maxsize=1)
+def _lut_file_map():
+    """Scan each LUT directory once and map the normcased filename to its full path."""
+    files = {}
+    for directory in _LUT_DIRECTORIES:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    key = os.path.normcase(entry.name)
+                    if key not in files and entry.is_file():
+                        files[key] = entry.path
+        except OSError:
+            continue
+    return files
+
+@functools.lru_cache(maxsize=64)
+def _resolve_lut_path(lut_name):
+    """Return the full path of a named LUT, or None if it is not installed."""
+    filename = _LUT_NAMES.get(lut_name, f"{lut_name}.cube")
+    return _lut_file_map().get(os.path.normcase(filename))
+
+def _summarize(items, limit=5):
+    """Render at most `limit` items for a log message, noting how many were left out."""
+    if len(items) <= limit:
+        return str(items)
+    return "%s ...+%d more" % (items[:limit], len(items) - limit)
+
+def _flatten_paths(paths):
+    """Yield file paths from a single path or an arbitrarily nested iterable of paths."""
+    if isinstance(paths, (str, os.PathLike)):
+        yield os.fspath(paths)
+        return
+    for entry in paths or ():
+        yield from _flatten_paths(entry)
+
+def _existing_files(paths):
+    """Return the paths that name regular files, listing each parent directory once."""
+    by_dir = defaultdict(list)
+    for path in paths:
+        by_dir[os.path.dirname(path) or "."].append(path)
+
+    found = set()
+    for directory, dir_paths in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                present = {os.path.normcase(e.name) for e in entries if e.is_file()}
+        except OSError:
+            continue
+        found.update(p for p in dir_paths if os.path.normcase(os.path.basename(p)) in present)
+    # Keep the caller's order for the import
+    return [p for p in paths if p in found]
+
+def _iter_segments(source):
+    """Iterate trimmed segments from a list/iterable, or from a queue.Queue until a None sentinel."""
+    if isinstance(source, queue.Queue):
+        return iter(source.get, None)
+    return iter(source or ())
+
+def _safe_apply_lut(clip, lut_path):
+    try:
+        clip.ApplyLUT(lut_path)
+    except Exception as e:
+        logging.exception("Failed to apply LUT on clip: %s", e)
+
+def _controller_action(method):
+    """Wait for the background connect, and treat the outermost public call as one scripted action."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._ready.wait()
+        # Action state is per thread, so worker threads and the GUI each get their own actions;
+        # nested public calls share the outer action, and with it the cached timeline handle
+        state = self._action_state
+        depth = getattr(state, "depth", 0)
+        if depth == 0:
+            state.timeline = None
+            state.track_cache = {}
+        state.depth = depth + 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            state.depth = depth
+    return wrapper
 
 class ResolveController:
-    def __init__(self, retries=3, delay=2):
-        attempt = 0
+    _instance = None
+    _instance_lock = threading.Lock()
+    # platform.platform() can shell out, so probe it once per process
+    _platform_info = None
+
+    @classmethod
+    def get(cls, *args, **kwargs):
+        """Return the process-wide controller, creating it (and its Resolve connection) on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(*args, **kwargs)
+            return cls._instance
+
+    def __init__(self, retries=8, delay=0.05, max_delay=MAX_CONNECT_BACKOFF):
         self.resolve = None
         self.api_helper = None
-        
-        while attempt < retries:
+        self.caps = Capabilities()
+        self._api_methods = frozenset()
+        self.project_manager = None
+        self.project = None
+        self.media_pool = None
+        self.fps = 30
+        self._default_lut_path = None
+        self._last_auto_applied_timeline_id = None
+        self._tc_consts = dict(_FPS_DEFAULTS)
+        self._clip_name_cache = OrderedDict()
+        # Guards _clip_name_cache, which worker threads and the GUI update concurrently
+        self._clip_name_lock = threading.Lock()
+        # Per-thread depth, timeline handle and track cache of the current scripted action
+        self._action_state = threading.local()
+        self._last_render_settings = None
+        self._lut_executor = None
+        self.refresh_lut_cache()
+
+        # Connect in the background so callers can build the UI meanwhile; see wait_ready()
+        self._ready = threading.Event()
+        self._cancel = threading.Event()
+        self._connect_error = None
+        threading.Thread(
+            target=self._connect_worker, args=(retries, delay, max_delay),
+            name="ResolveConnect", daemon=True
+        ).start()
+
+    def _refresh_caps(self, timeline):
+        """Probe the timeline methods the first time a timeline exists, if none was open at connect."""
+        helper = self.api_helper
+        if helper is not None and timeline and not helper.is_probed("timeline"):
+            if helper.probe(timeline, self.media_pool):
+                self.caps = Capabilities(helper)
+                self._api_methods = helper.get_supported_methods()
+                logging.info("API Feature Support: %s", helper.get_feature_support_info())
+
+    def supports(self, method_name):
+        """Return True if the connected Resolve exposes method_name, e.g. "timeline.AddTransition"."""
+        return method_name in self._api_methods
+
+    def wait_ready(self, timeout=None):
+        """Wait for the connection attempt to finish; re-raise its error if it failed."""
+        if not self._ready.wait(timeout):
+            raise TimeoutError("Timed out waiting for the DaVinci Resolve connection.")
+        if self._connect_error is not None:
+            raise self._connect_error
+
+    def cancel_connect(self):
+        """Abort a pending connection attempt, e.g. when the application is shutting down."""
+        self._cancel.set()
+
+    def _connect_worker(self, retries, delay, max_delay):
+        try:
+            self._connect(retries, delay, max_delay)
+        except Exception as e:
+            self._connect_error = e
+        finally:
+            self._ready.set()
+
+    def _connect(self, retries, delay, max_delay):
+        dvr = _get_dvr()
+        if dvr is None:
+            # Retrying cannot help when the scripting module itself failed to load
+            logging.critical("DaVinci Resolve scripting module is not loaded; not attempting to connect.")
+
+        attempts_made = 0
+        for attempt in range(retries if dvr is not None else 0):
+            attempts_made += 1
             try:
                 self.resolve = dvr.scriptapp("Resolve")
                 if self.resolve:
@@ -23,10 +257,15 @@ class ResolveController:
                     
                     # Initialize API helper to detect available methods
                     self.api_helper = ResolveAPIHelper(self.resolve)
+                    self.caps = Capabilities(self.api_helper)
+                    self._api_methods = self.api_helper.get_supported_methods()
                     logging.info("API Feature Support: %s", self.api_helper.get_feature_support_info())
                     break
                 else:
                     logging.warning("Attempt %d: DaVinci Resolve returned None. Is it running?", attempt + 1)
+            except ImportError as e:
+                logging.error("Attempt %d: DaVinci Resolve scripting module is unusable: %s", attempt + 1, e)
+                break
             except Exception as e:
                 # ADDED: More explicit logging on why it failed
                 logging.warning(
@@ -34,12 +273,16 @@ class ResolveController:
                     attempt + 1, e
                 )
                 logging.warning("Check if fusionscript.dll is on PATH or bundled with your EXE.")
-            attempt += 1
-            time.sleep(delay)
+            # Exponential backoff (capped) with a little jitter; no wait after the final attempt.
+            # Waiting on the cancel event lets cancel_connect() cut the backoff short.
+            if attempt < retries - 1:
+                if self._cancel.wait(min(delay * (2 ** attempt) + random.uniform(0, 0.05), max_delay)):
+                    logging.info("Connection to DaVinci Resolve cancelled.")
+                    break
 
         # MODIFIED: Raise a more descriptive error
         if not self.resolve:
-            logging.critical("Failed to connect to DaVinci Resolve after %d attempts.", retries)
+            logging.critical("Failed to connect to DaVinci Resolve after %d attempt(s).", attempts_made)
             raise Exception(
                 "Could not connect to DaVinci Resolve. Check if Resolve is running "
                 "and fusionscript.dll is accessible."
@@ -52,6 +295,7 @@ class ResolveController:
                 or self.project_manager.CreateProject("Drone Edit Project")
             )
             self.media_pool = self.project.GetMediaPool()
+            self.fps = self._get_timeline_fps()
             
             # Log more detailed environment info
             self._log_environment_info()
@@ -59,17 +303,37 @@ class ResolveController:
             logging.critical("Error initializing project: %s", e)
             raise
 
+    def _get_timeline_fps(self, default=30):
+        """Read the project's timeline frame rate once; fall back to the default on failure."""
+        try:
+            fps = float(self.project.GetSetting("timelineFrameRate"))
+            return fps if fps > 0 else default
+        except Exception as e:
+            logging.warning("Could not read timeline frame rate, assuming %s fps: %s", default, e)
+            return default
+
+    def refresh_lut_cache(self):
+        """Re-scan the LUT directories and re-resolve the auto LUT (call after LUTs change on disk)."""
+        _lut_file_map.cache_clear()
+        _resolve_lut_path.cache_clear()
+        # Found by the directory scan, so no separate existence check is needed
+        self._default_lut_path = _resolve_lut_path("Default")
+
     def _log_environment_info(self):
         """Log detailed environment information for debugging."""
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
         try:
             # OS info
-            logging.info("Operating System: %s", platform.platform())
+            if ResolveController._platform_info is None:
+                ResolveController._platform_info = platform.platform()
+            logging.info("Operating System: %s", ResolveController._platform_info)
             
             # Python info
             logging.info("Python Version: %s", platform.python_version())
             
             # Resolve info if available
-            if hasattr(self.resolve, "GetVersionString"):
+            if callable(getattr(self.resolve, "GetVersionString", None)):
                 logging.info("DaVinci Resolve Version: %s", self.resolve.GetVersionString())
             
             # Log relevant environment variables
@@ -87,24 +351,41 @@ class ResolveController:
         except Exception as e:
             logging.warning("Error logging environment info: %s", e)
 
+    @_controller_action
     def import_media(self, file_paths):
+        """Import one path or a (possibly nested) list of paths with a single ImportMedia call."""
         try:
-            valid_paths = [p for p in file_paths if os.path.exists(p)]
+            # Flatten and de-duplicate while keeping order, so one batch never imports a file twice
+            file_paths = list(dict.fromkeys(_flatten_paths(file_paths)))
+
+            # Filter locally so missing files never cost a Resolve round-trip
+            valid_paths = _existing_files(file_paths)
             if not valid_paths:
-                logging.error("None of the provided file paths exist: %s", file_paths)
+                logging.error("None of the provided file paths exist: %s", _summarize(file_paths))
                 return None
+            if len(valid_paths) != len(file_paths):
+                valid_set = set(valid_paths)
+                logging.warning("Skipping missing files: %s", _summarize([p for p in file_paths if p not in valid_set]))
                 
             new_items = self.media_pool.ImportMedia(valid_paths)
+            # The media pool changed, so drop names that may now be stale
+            with self._clip_name_lock:
+                self._clip_name_cache.clear()
             if new_items:
-                logging.info("Imported media: %s", valid_paths)
+                logging.info("Imported %d media file(s).", len(valid_paths))
             else:
-                logging.error("Media import returned None for files: %s", valid_paths)
+                logging.error("Media import returned None for files: %s", _summarize(valid_paths))
             return new_items
         except Exception as e:
             logging.exception("Error importing media: %s", e)
             return None
 
-    def create_timeline(self, clips):
+    def import_media_many(self, path_lists):
+        """Import several path lists in one combined ImportMedia round-trip."""
+        return self.import_media(path_lists)
+
+    @_controller_action
+    def create_timeline(self, clips, auto_enhance=True):
         try:
             if not clips:
                 logging.error("No clips provided to create timeline.")
@@ -112,80 +393,156 @@ class ResolveController:
             timeline = self.media_pool.CreateTimelineFromClips("Auto Timeline", clips)
             if timeline:
                 logging.info("Timeline created successfully with %d clip(s).", len(clips))
-                self.auto_apply_color_and_transitions(timeline)
+                if auto_enhance:
+                    self.auto_apply_color_and_transitions(timeline)
             else:
-                logging.error("Failed to create timeline with clips: %s", clips)
+                logging.error("Failed to create timeline with %d clip(s).", len(clips))
             return timeline
         except Exception as e:
             logging.exception("Exception while creating timeline: %s", e)
             return None
 
+    @_controller_action
     def get_current_timeline(self):
+        state = self._action_state
+        if state.timeline:
+            return state.timeline
         try:
             timeline = self.project.GetCurrentTimeline()
             if not timeline:
                 logging.warning("No current timeline found.")
+            self._refresh_caps(timeline)
+            state.timeline = timeline
             return timeline
         except Exception as e:
             logging.exception("Error retrieving current timeline: %s", e)
             return None
 
+    @_controller_action
     def apply_lut(self, lut_path):
+        if not lut_path or not os.path.isfile(lut_path):
+            logging.error("LUT file not found: %s", lut_path)
+            return
         timeline = self.get_current_timeline()
         if timeline:
-            for clip in timeline.GetItemsInTrack("video", 1):
-                try:
-                    clip.ApplyLUT(lut_path)
-                except Exception as e:
-                    logging.exception("Failed to apply LUT on clip: %s", e)
+            self._apply_lut_to_clips(self._get_track_items(timeline), lut_path)
             logging.info("LUT '%s' applied to timeline clips.", lut_path)
         else:
             logging.warning("No timeline found to apply LUT.")
 
+    def _get_track_items(self, timeline, track_type="video", track_index=1):
+        """Return the items on a track as an ordered list, cached for the current action."""
+        # Entries live for one scripted action and are dropped whenever the track is mutated
+        track_cache = getattr(self._action_state, "track_cache", None)
+        if track_cache is None:
+            track_cache = self._action_state.track_cache = {}
+        key = (id(timeline), track_type, track_index)
+        cached = track_cache.get(key)
+        if cached is not None and cached[0] is timeline:
+            return cached[1]
+
+        self._refresh_caps(timeline)
+        if self.caps.item_list:
+            items = list(timeline.GetItemListInTrack(track_type, track_index) or [])
+        else:
+            # Older API: GetItemsInTrack returns a {index: item} dict
+            by_index = timeline.GetItemsInTrack(track_type, track_index) or {}
+            items = [by_index[k] for k in sorted(by_index)]
+        track_cache[key] = (timeline, items)
+        return items
+
+    def _invalidate_track_cache(self):
+        """Forget cached track items after the timeline has been mutated."""
+        self._action_state.track_cache = {}
+
+    def _apply_lut_to_clips(self, clips, lut_path):
+        """Apply a LUT to each clip, overlapping the per-clip API round-trips across threads."""
+        if len(clips) <= 1:
+            for clip in clips:
+                _safe_apply_lut(clip, lut_path)
+            return
+        # One pool for the controller's lifetime, so repeated passes don't respawn threads
+        if self._lut_executor is None:
+            self._lut_executor = ThreadPoolExecutor(
+                max_workers=LUT_APPLY_WORKERS, thread_name_prefix="ApplyLUT"
+            )
+        futures = [self._lut_executor.submit(clip.ApplyLUT, lut_path) for clip in clips]
+        # Surface failures on the calling thread as they complete
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logging.exception("Failed to apply LUT on clip: %s", e)
+
+    def _get_tc_consts(self, fps):
+        """Return cached (fps, frames per minute, frames per hour) divisors for a frame rate."""
+        consts = self._tc_consts.get(fps)
+        if consts is None:
+            consts = self._tc_consts[fps] = (fps, fps * 60, fps * 3600)
+        return consts
+
     def seconds_to_timecode(self, seconds, fps=30):
-        frames = int(round(seconds * fps))
-        h = frames // (fps * 3600)
-        frames %= (fps * 3600)
-        m = frames // (fps * 60)
-        frames %= (fps * 60)
-        s = frames // fps
-        f = frames % fps
-        return f"{h:02d}:{m:02d}:{s:02d}:{f:02d}"
+        fps, frames_per_min, frames_per_hour = self._get_tc_consts(fps)
+        frames = int(seconds * fps + 0.5)
+        h, frames = divmod(frames, frames_per_hour)
+        m, frames = divmod(frames, frames_per_min)
+        s, f = divmod(frames, fps)
+        return "%02d:%02d:%02d:%02d" % (h, m, s, f)
 
     def get_clip_name(self, clip_item):
         try:
             if not clip_item:
                 return "Unknown"
+
+            # Scene lists repeat the same source clip; the cached entry pins the object so its id stays unique
+            with self._clip_name_lock:
+                cached = self._clip_name_cache.get(id(clip_item))
+                if cached is not None and cached[0] is clip_item:
+                    self._clip_name_cache.move_to_end(id(clip_item))
+                    return cached[1]
                 
-            if not hasattr(clip_item, "GetClipProperty"):
+            clip_type = type(clip_item)
+            has_gcp = _HAS_GCP_CACHE.get(clip_type)
+            if has_gcp is None:
+                has_gcp = _HAS_GCP_CACHE[clip_type] = callable(getattr(clip_item, "GetClipProperty", None))
+            if not has_gcp:
                 logging.warning("Clip item of type %s lacks GetClipProperty.", type(clip_item))
                 return "Unknown"
 
-            name = None
-            # Safely try each property
-            for prop in ["File Path", "Clip Name", "Name"]:
-                try:
-                    name = clip_item.GetClipProperty(prop)
-                    if name:
-                        break
-                except:
-                    pass
+            # Fetch the whole property dict in one call rather than one call per key
+            try:
+                props = clip_item.GetClipProperty() or {}
+            except Exception:
+                props = {}
+            name = props.get("File Path") or props.get("Clip Name") or props.get("Name")
                     
             if not name:
                 try:
                     name = clip_item.GetName()
                 except:
                     name = None
-            return name or "Unknown"
+            name = name or "Unknown"
+            with self._clip_name_lock:
+                self._clip_name_cache[id(clip_item)] = (clip_item, name)
+                if len(self._clip_name_cache) > CLIP_NAME_CACHE_SIZE:
+                    self._clip_name_cache.popitem(last=False)
+            return name
         except Exception as e:
             logging.exception("Error in get_clip_name: %s", e)
             return "Unknown"
 
-    def update_timeline_with_trimmed_clips(self, new_clips):
+    @_controller_action
+    def update_timeline_with_trimmed_clips(self, new_clips, auto_enhance=True, batch_size=32):
+        """Replace the video track with trimmed segments from a list, iterable, or None-terminated queue."""
         try:
-            if not new_clips:
+            # Segments are streamed: the track is cleared once the first one arrives, then each
+            # batch is appended as it fills. Callers pass MediaPoolItems, not items on this track
+            segments = _iter_segments(new_clips)
+            first = next(segments, None)
+            if first is None:
                 logging.warning("No new clips provided to update timeline.")
                 return False
+            segments = chain((first,), segments)
                 
             timeline = self.get_current_timeline()
             if not timeline:
@@ -194,72 +551,131 @@ class ResolveController:
 
             logging.info("Clearing original timeline clips.")
             # Use API helper for version-safe method call
-            all_clips = timeline.GetItemListInTrack("video", 1)
+            all_clips = self._get_track_items(timeline)
             
-            if self.api_helper and self.api_helper.is_method_available("timeline.RemoveItem"):
+            if self.caps.delete_clips:
+                # Single round-trip for the whole track instead of one RemoveItem per clip
+                try:
+                    if all_clips and not timeline.DeleteClips(all_clips, False):
+                        logging.warning("timeline.DeleteClips reported failure while clearing clips.")
+                except Exception as e:
+                    logging.exception("Error deleting timeline clips: %s", e)
+            elif self.caps.remove_item:
+                remove_item = self.api_helper.safe_remove_timeline_item
                 for c in all_clips:
-                    self.api_helper.safe_remove_timeline_item(timeline, c)
+                    remove_item(timeline, c)
             else:
-                logging.warning("timeline.RemoveItem is not available in this API version. Skipping old clip removal.")
-
-            for (source_clip, start_sec, end_sec) in new_clips:
-                clip_name = self.get_clip_name(source_clip)
-                logging.info("Appending new clip: Original clip %s, from %s to %s", clip_name, start_sec, end_sec)
-
-                has_duplicate_method = (
-                    self.api_helper and 
-                    self.api_helper.is_method_available("mediaPool.DuplicateMediaPoolItem")
-                )
-                
-                trimmed_clip = None
-                if has_duplicate_method:
-                    try:
-                        trimmed_clip = self.media_pool.DuplicateMediaPoolItem(source_clip)
-                    except Exception:
-                        logging.exception("Failed to duplicate MediaPoolItem. Falling back to original clip.")
+                logging.warning("Neither timeline.DeleteClips nor timeline.RemoveItem is available in this API version. Skipping old clip removal.")
+            self._invalidate_track_cache()
 
-                final_clip = trimmed_clip if trimmed_clip else source_clip
-
-                subclip_name = f"{clip_name}_sub_{start_sec}_{end_sec}"
-                start_tc = self.seconds_to_timecode(start_sec)
-                end_tc = self.seconds_to_timecode(end_sec)
-
-                try:
-                    self.media_pool.AppendToTimeline([final_clip])
-                except Exception as e:
-                    logging.exception("Failed to append clip to timeline: %s", e)
+            # Trim on append, flushing one AppendToTimeline call per batch of segments;
+            # batch_size=None collects everything into a single call
+            failed_batches = 0
+            if batch_size is None:
+                failed_batches += not self._append_segments(list(segments))
+            else:
+                batch = []
+                for segment in segments:
+                    batch.append(segment)
+                    if len(batch) >= batch_size:
+                        failed_batches += not self._append_segments(batch)
+                        batch = []
+                if batch:
+                    failed_batches += not self._append_segments(batch)
+            if failed_batches:
+                logging.error("%d batch(es) of trimmed clips failed to append; the timeline is incomplete.",
+                              failed_batches)
+                return False
 
             logging.info("Timeline updated with trimmed clips.")
-            self.auto_apply_color_and_transitions(timeline)
+            # The track contents changed, so any earlier auto pass no longer covers it
+            self._last_auto_applied_timeline_id = None
+            if auto_enhance:
+                self.auto_apply_color_and_transitions(timeline)
             return True
         except Exception as e:
             logging.exception("Error updating timeline with trimmed clips: %s", e)
             return False
 
-    def auto_apply_color_and_transitions(self, timeline):
+    def _clip_fps(self, clip):
+        """Return a source clip's own frame rate, or the timeline's when the clip doesn't report one."""
+        try:
+            # Reported as e.g. 59.94, "25" or "29.97 DF"
+            fps = float(str(clip.GetClipProperty("FPS")).split()[0])
+            if fps > 0:
+                return fps
+        except Exception:
+            pass
+        return self.fps
+
+    def _append_segments(self, segments):
+        """Append (clip, start_sec, end_sec) segments in one trim-on-append call; True if Resolve appended them."""
+        # clipInfo frames count in the source clip's own rate, which differs from the timeline's
+        # for mixed-rate footage; segments repeat source clips, so look each rate up once
+        clip_fps = {}
+        for clip, _, _ in segments:
+            if id(clip) not in clip_fps:
+                clip_fps[id(clip)] = self._clip_fps(clip)
+        # Clip names cost an API call each, so only look them up when the batch record is emitted
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("Appending %d new clip(s):\n%s", len(segments), "\n".join(
+                f"  Original clip {self.get_clip_name(source_clip)}, from {start_sec} to {end_sec}"
+                for source_clip, start_sec, end_sec in segments
+            ))
+        # round() without ndigits already returns an int; bind it locally for the comprehension
+        _round = round
+        clip_infos = [
+            {"mediaPoolItem": clip,
+             "startFrame": _round(start * clip_fps[id(clip)]), "endFrame": _round(end * clip_fps[id(clip)])}
+            for clip, start, end in segments
+        ]
+
+        try:
+            appended = self.media_pool.AppendToTimeline(clip_infos)
+            if not appended:
+                logging.warning("AppendToTimeline appended nothing for %d clip(s).", len(clip_infos))
+            return bool(appended)
+        except Exception as e:
+            logging.exception("Failed to append clips to timeline: %s", e)
+            return False
+        finally:
+            self._invalidate_track_cache()
+
+    @_controller_action
+    def auto_apply_color_and_transitions(self, timeline, force=False):
         if not timeline:
             logging.warning("No timeline found to apply color/transitions.")
             return
+        self._refresh_caps(timeline)
+
+        # Skip a repeat pass over a timeline whose track has not changed since the last one
+        try:
+            timeline_id = timeline.GetUniqueId()
+        except Exception:
+            timeline_id = None
+        if not force and timeline_id is not None and timeline_id == self._last_auto_applied_timeline_id:
+            logging.info("Auto color/transitions already applied to this timeline; skipping.")
+            return
+        self._last_auto_applied_timeline_id = timeline_id
+
+        # One track fetch shared by the LUT pass and the transition pass
+        video_items = (
+            self._get_track_items(timeline)
+            if self._default_lut_path or self.caps.add_transition else []
+        )
 
         # Apply LUT if available
-        lut_path = "C:/Path/To/SomeDefaultLUT.cube"
-        if os.path.exists(lut_path):
-            for clip in timeline.GetItemsInTrack("video", 1):
-                try:
-                    clip.ApplyLUT(lut_path)
-                except Exception as e:
-                    logging.exception("Failed to apply LUT on clip: %s", e)
+        if self._default_lut_path:
+            self._apply_lut_to_clips(video_items, self._default_lut_path)
             logging.info("Auto LUT applied to timeline clips.")
         else:
             logging.warning("Auto LUT path not found; skipping LUT color pass.")
 
         # Add transitions using the API helper
-        if self.api_helper and self.api_helper.is_method_available("timeline.AddTransition"):
-            video_items = timeline.GetItemListInTrack("video", 1)
-            for i in range(len(video_items) - 1):
-                self.api_helper.safe_add_transition(
-                    timeline, "Cross Dissolve", video_items[i], video_items[i+1], 30
-                )
+        if self.caps.add_transition:
+            add_transition = self.api_helper.safe_add_transition
+            for clip_a, clip_b in pairwise(video_items):
+                add_transition(timeline, "Cross Dissolve", clip_a, clip_b, 30)
             logging.info("Attempted to add transitions between consecutive timeline clips.")
         else:
             logging.warning(
@@ -268,28 +684,78 @@ class ResolveController:
             
     def get_lut_path(self, lut_name):
         """Get path to a specific LUT based on name."""
-        lut_directories = [
-            os.path.expanduser("~/Documents/Blackmagic Design/DaVinci Resolve/LUT"),
-            "C:/ProgramData/Blackmagic Design/DaVinci Resolve/Support/LUT",
-            "/Library/Application Support/Blackmagic Design/DaVinci Resolve/LUT"
-        ]
-        
-        lut_names = {
-            "Default": "Default.cube",
-            "Cinematic": "Film Look.cube",
-            "Vintage": "Vintage Film.cube"
-        }
-        
-        filename = lut_names.get(lut_name, f"{lut_name}.cube")
-        
-        for directory in lut_directories:
-            path = os.path.join(directory, filename)
-            if os.path.exists(path):
-                return path
-                
-        logging.warning(f"LUT '{lut_name}' not found in standard locations.")
-        return None
+        path = _resolve_lut_path(lut_name)
+        if path is None:
+            logging.warning("LUT '%s' not found in standard locations.", lut_name)
+        return path
         
+    @_controller_action
+    def export_video(self, user_settings, on_progress=None, poll_ms=500):
+        """Queue and start a render of the current timeline; progress is polled on a daemon thread."""
+        try:
+            if not self.get_current_timeline():
+                logging.warning("No timeline found to export.")
+                return None
+
+            render_settings = {
+                "TargetDir": user_settings.get("export_location", os.path.join(os.getcwd(), "Exports")),
+            }
+            preset_name = user_settings.get("render_preset")
+            if preset_name and self.project.LoadRenderPreset(preset_name):
+                # A saved Resolve preset carries the format settings in one call; Resolve's
+                # state no longer matches what we last pushed
+                self._last_render_settings = None
+            else:
+                if preset_name:
+                    logging.warning("Render preset '%s' could not be loaded; using export settings.", preset_name)
+                render_settings.update(_render_size_settings(user_settings.get("export_resolution", "1080p")))
+            # Resolve re-validates every setting on each push, so skip it when nothing changed
+            settings_key = tuple(sorted(render_settings.items()))
+            if settings_key != self._last_render_settings:
+                if not self.project.SetRenderSettings(render_settings):
+                    logging.error("Resolve rejected render settings: %s", render_settings)
+                    return None
+                self._last_render_settings = settings_key
+
+            job_id = self.project.AddRenderJob()
+            if not job_id:
+                logging.error("Failed to add render job.")
+                return None
+            if not self.project.StartRendering(job_id):
+                logging.error("Failed to start rendering job %s.", job_id)
+                return None
+            logging.info("Started render job %s.", job_id)
+
+            # Poll off the caller's thread so a GUI never blocks waiting on Resolve
+            threading.Thread(
+                target=self._render_poll, args=(job_id, on_progress, poll_ms),
+                name="ResolveRenderPoll", daemon=True
+            ).start()
+            return job_id
+        except Exception as e:
+            logging.exception("Error exporting video: %s", e)
+            return None
+
+    def _render_poll(self, job_id, on_progress, poll_ms):
+        """Report render job status changes to on_progress until rendering stops."""
+        last_status = None
+        try:
+            while True:
+                rendering = self.project.IsRenderingInProgress()
+                status = self.project.GetRenderJobStatus(job_id)
+                # Only notify on change so listeners are not flooded with identical updates
+                if status != last_status:
+                    last_status = status
+                    if on_progress:
+                        on_progress(status)
+                if not rendering:
+                    break
+                time.sleep(poll_ms / 1000.0)
+            logging.info("Render job %s finished with status: %s", job_id, last_status)
+        except Exception as e:
+            logging.exception("Error polling render job %s: %s", job_id, e)
+
+    @_controller_action
     def fusion_automation(self):
         """Apply advanced Fusion effects to the current timeline."""
         try:
@@ -297,12 +763,38 @@ class ResolveController:
             if not timeline:
                 logging.warning("No timeline found for Fusion automation.")
                 return False
-                
-            # This is just a stub - expanded implementation would depend on
-            # what Fusion effects you want to apply
-            logging.info("Fusion automation not fully implemented yet.")
+
+            video_items = self._get_track_items(timeline)
+            if not video_items:
+                logging.warning("No clips on the timeline for Fusion automation.")
+                return False
+
+            first_item = video_items[0]
+            comp = (
+                first_item.GetFusionCompByIndex(1)
+                if first_item.GetFusionCompCount()
+                else first_item.AddFusionComp()
+            )
+            if not comp:
+                logging.warning("Could not open a Fusion composition for the first clip.")
+                return False
+
+            # Lock the comp so Fusion re-evaluates the graph once, after every tool is in place
+            comp.Lock()
+            comp.StartUndo("AI Automation")
+            try:
+                comp.AddTool("Tracker")
+                title = comp.AddTool("TextPlus")
+                if title:
+                    title.SetInput("StyledText", timeline.GetName())
+                    title.SetAttrs({"TOOLS_Name": "AutoTitle"})
+            finally:
+                comp.EndUndo(True)
+                comp.Unlock()
+
+            logging.info("Fusion automation added tracker and title tools to the first clip.")
             return True
             
         except Exception as e:
             logging.exception("Error in fusion_automation: %s", e)
-            return False
\ No newline at end of file
+            return False
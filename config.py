@@ -1,34 +1,63 @@
+import atexit
 import logging
 import os
-
-# Enhanced logging configuration with function names and timestamps.
-LOG_FILE = 'drone_video_editor.log'
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-)
-console = logging.StreamHandler()
-console.setLevel(logging.INFO)
-formatter = logging.Formatter('%(levelname)s - %(message)s')
-console.setFormatter(formatter)
-logging.getLogger('').addHandler(console)
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 ## ADDED: Filter to remove duplicate log messages
 class NoDuplicateFilter(logging.Filter):
     def __init__(self):
         super().__init__()
         self.last_msg = None
+        self.last_hash = None
 
     def filter(self, record):
         current_msg = record.getMessage()
-        if current_msg == self.last_msg:
+        # Store the formatted text so the queue handler and formatters don't redo the % step
+        record.msg = current_msg
+        record.args = None
+        # Distinct messages are rejected on the int compare; the string compare only
+        # runs to confirm a hash match
+        current_hash = hash(current_msg)
+        if current_hash == self.last_hash and current_msg == self.last_msg:
             return False
+        self.last_hash = current_hash
         self.last_msg = current_msg
         return True
 
-logger = logging.getLogger('')
-logger.addFilter(NoDuplicateFilter())
+LOG_FILE = 'drone_video_editor.log'
+
+def _configure_logging():
+    """Install the file/console handlers behind a queue listener, once per process."""
+    logger = logging.getLogger('')
+    # A reload or second import path must not stack another console handler and listener
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
+        return
+
+    # Enhanced logging configuration with function names and timestamps.
+    logging.basicConfig(
+        filename=LOG_FILE,
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
+    )
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    formatter = logging.Formatter('%(levelname)s - %(message)s')
+    console.setFormatter(formatter)
+    logger.addHandler(console)
+    logger.addFilter(NoDuplicateFilter())
+
+    # Hand records to a background listener so file/console I/O never runs on the
+    # thread issuing Resolve calls; the listener drives the handlers configured above.
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
+_configure_logging()
 
 # Default settings for the application
 DEFAULT_SETTINGS = {
@@ -278,8 +278,7 @@ class AutomatedTitlesDialog(QDialog):
                 return
             
             # Check if the InsertFusionTitleIntoTimeline method is available
-            if (hasattr(self.controller, 'api_helper') and 
-                self.controller.api_helper.is_method_available("timeline.InsertFusionTitleIntoTimeline")):
+            if self.controller.supports("timeline.InsertFusionTitleIntoTimeline"):
                 
                 # This would be the actual implementation using the Resolve API
                 title_name = self.title_combo.currentText()
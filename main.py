@@ -1,31 +1,59 @@
 import sys
 import logging
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 
-from ui import DroneVideoEditor
-from backend import ResolveController
+# Imported first for its logging setup, so backend's import-time and connection logging is handled
 from config import DEFAULT_SETTINGS
+from backend import ResolveController
+
+# How long, in seconds, each wait for the Resolve connection blocks before Qt repaints (~60 fps)
+SPLASH_POLL_INTERVAL = 0.016
 
 def main():
-    # Attempt to initialize ResolveController
+    # Start connecting to Resolve in the background while Qt and the UI are set up
+    backend = ResolveController.get()
+    app = QApplication(sys.argv)
+
+    # Paint a splash right away so the connection handshake isn't a blank pause
+    pixmap = QPixmap(420, 160)
+    pixmap.fill(QColor("#202020"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "Connecting to DaVinci Resolve...",
+        Qt.AlignmentFlag.AlignCenter, QColor("white")
+    )
+    splash.show()
+    app.processEvents()
+
     try:
-        backend = ResolveController()
+        # Keep the event loop turning while the connect thread works
+        while True:
+            try:
+                backend.wait_ready(SPLASH_POLL_INTERVAL)
+                break
+            except TimeoutError:
+                app.processEvents()
     except Exception as e:
         logging.critical("Fatal error initializing backend: %s", e)
-        # We need a QApplication to show message boxes, so create it here:
-        app = QApplication(sys.argv)
+        splash.close()
         QMessageBox.critical(
-            None, 
+            None,
             "Resolve Error",
             "Cannot initialize DaVinci Resolve.\n"
             "Check if DaVinci Resolve is running or if fusionscript.dll is present."
         )
         sys.exit(1)
 
-    # If successful, proceed with the main application
-    app = QApplication(sys.argv)
+    # If successful, proceed with the main application; the UI module is only
+    # imported now, so a failed connection reaches its error dialog sooner
+    from ui import DroneVideoEditor, load_style_sheet
+    # One application-wide stylesheet, parsed once instead of per widget
+    app.setStyleSheet(load_style_sheet())
     editor = DroneVideoEditor(backend, DEFAULT_SETTINGS)
     editor.show()
+    splash.finish(editor)
     sys.exit(app.exec())
 
 if __name__ == '__main__':
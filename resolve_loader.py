@@ -1,85 +1,168 @@
 import sys
 import os
 import logging
-import platform
+import stat
+import threading
+import functools
+import importlib
+import importlib.machinery
+import importlib.util
+
+# Module found by load_resolve_script(); a miss isn't cached, so a later call searches again
+_RESOLVE_CACHE = None
+_RESOLVE_LOCK = threading.Lock()
+
+# Modules loaded by load_dynamic, keyed by name plus file identity
+_DYNAMIC_MODULES = {}
+
+# Set once _ensure_resolve_on_path() has run for this process
+_path_configured = False
+
+# Standard Resolve installation paths on Windows, resolved once at import
+_PROGRAMDATA = os.environ.get('PROGRAMDATA', 'C:\\ProgramData')
+_WIN_MODULE_DIR = os.path.join(
+    _PROGRAMDATA, "Blackmagic Design\\DaVinci Resolve\\Support\\Developer\\Scripting\\Modules"
+)
+_WIN_DLL_PATHS = (
+    "C:\\Program Files\\Blackmagic Design\\DaVinci Resolve\\fusionscript.dll",
+    "C:\\Program Files\\Blackmagic Design\\DaVinci Resolve Studio\\fusionscript.dll",
+    # The ProgramData Scripting directory may also hold the library
+    os.path.join(_WIN_MODULE_DIR, "fusionscript.dll"),
+)
+
+_MAC_DLL_PATHS = (
+    "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so",
+    "/Applications/DaVinci Resolve Studio/DaVinci Resolve Studio.app/Contents/Libraries/Fusion/fusionscript.so",
+)
+_LINUX_DLL_PATHS = (
+    "/opt/resolve/libs/Fusion/fusionscript.so",
+    "/opt/resolve/libs/fusionscript.so",
+)
+
+# sys.platform is fixed for the process, so the OS dispatch is a single dict lookup
+_IS_WIN = sys.platform == "win32"
+_PATHS_BY_PLATFORM = {
+    "win32": _WIN_DLL_PATHS,
+    "darwin": _MAC_DLL_PATHS,
+    "linux": _LINUX_DLL_PATHS,
+}
+
+# Directories holding the Resolve scripting modules, tried on sys.path
+_MODULE_PATHS = (
+    _WIN_MODULE_DIR,
+    "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",  # macOS
+    "/opt/resolve/Developer/Scripting/Modules"  # Linux
+)
+
+@functools.lru_cache(maxsize=64)
+def _stat_mode(path):
+    """Return the st_mode of path, or None if it is missing; memoized per path."""
+    # A direct stat reports why a path is unusable instead of os.path.exists' blanket False,
+    # which matters for installs on redirected or network drives
+    try:
+        return os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError as e:
+        logging.warning("Could not stat %s: %s", path, e)
+        return None
+
+def _is_dir(path):
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISDIR(mode)
+
+@functools.lru_cache(maxsize=32)
+def _dir_files(directory):
+    """Return the normcased names of the regular files in directory, read with one scandir."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(os.path.normcase(e.name) for e in entries if e.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+    except OSError as e:
+        logging.warning("Could not list %s: %s", directory, e)
+        return frozenset()
+
+def _is_file(path):
+    # Candidates sharing a directory are answered from one listing instead of a stat each
+    directory, name = os.path.split(path)
+    return os.path.normcase(name) in _dir_files(directory or ".")
+
+def _ensure_resolve_on_path():
+    """On Windows, prepend the existing fusionscript directories to PATH, once per process."""
+    global _path_configured
+    if _path_configured:
+        return
+    _path_configured = True
+    if not _IS_WIN:
+        return
+
+    # Probe each distinct parent directory once
+    path_parts = os.environ.get('PATH', '').split(os.pathsep)
+    path_dirs = set(path_parts)
+    added = []
+    for parent in dict.fromkeys(os.path.dirname(p) for p in get_fusion_script_paths()):
+        if parent not in path_dirs and _is_dir(parent):
+            added.append(parent)
+            path_dirs.add(parent)
+            logging.info("Added %s to PATH", parent)
+    if added:
+        # Same precedence as prepending one at a time, written back in a single assignment
+        os.environ['PATH'] = os.pathsep.join(added[::-1] + path_parts)
 
 def get_fusion_script_paths():
-    """Return potential paths for fusionscript.dll/so based on OS and common locations."""
-    paths = []
-    
+    """Yield potential paths for fusionscript.dll/so based on OS and common locations."""
     # Check environment variables first
     env_path = os.getenv("RESOLVE_SCRIPT_LIB")
     if env_path:
-        paths.append(env_path)
-    
-    # Check operating system
-    if platform.system() == "Windows":
-        # Standard Resolve installation paths on Windows
-        paths.extend([
-            "C:\\Program Files\\Blackmagic Design\\DaVinci Resolve\\fusionscript.dll",
-            "C:\\Program Files\\Blackmagic Design\\DaVinci Resolve Studio\\fusionscript.dll",
-            # Add the ProgramData path which might contain the Scripting directory
-            os.path.join(os.environ.get('PROGRAMDATA', 'C:\\ProgramData'), 
-                         "Blackmagic Design\\DaVinci Resolve\\Support\\Developer\\Scripting\\Modules\\fusionscript.dll")
-        ])
-        
-        # Add to PATH temporarily
-        for potential_path in paths:
-            if os.path.exists(os.path.dirname(potential_path)):
-                if os.path.dirname(potential_path) not in os.environ['PATH']:
-                    os.environ['PATH'] = os.path.dirname(potential_path) + os.pathsep + os.environ['PATH']
-                    logging.info("Added %s to PATH", os.path.dirname(potential_path))
-                
-    elif platform.system() == "Darwin":  # macOS
-        paths.extend([
-            "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so",
-            "/Applications/DaVinci Resolve Studio/DaVinci Resolve Studio.app/Contents/Libraries/Fusion/fusionscript.so"
-        ])
-    elif platform.system() == "Linux":
-        paths.extend([
-            "/opt/resolve/libs/Fusion/fusionscript.so",
-            "/opt/resolve/libs/fusionscript.so"
-        ])
-    
-    return paths
+        yield env_path
+
+    # Then the standard locations for this operating system
+    yield from _PATHS_BY_PLATFORM.get(sys.platform, ())
 
 def load_resolve_script():
+    """Return the DaVinci Resolve scripting module (or None), searching until one is found."""
+    global _RESOLVE_CACHE
+    if _RESOLVE_CACHE is None:
+        # Concurrent callers wait for one search instead of each running their own
+        with _RESOLVE_LOCK:
+            if _RESOLVE_CACHE is None:
+                _RESOLVE_CACHE = _find_resolve_script()
+    return _RESOLVE_CACHE
+
+def _find_resolve_script():
     """Attempt to load the DaVinci Resolve scripting module using multiple strategies."""
+    # Already imported (e.g. via DaVinciResolveScript): no import machinery or I/O needed
+    script_module = sys.modules.get("fusionscript")
+    if script_module is not None:
+        logging.info("Using already loaded fusionscript module.")
+        return script_module
+
     logging.info("Attempting to load DaVinci Resolve scripting module...")
     
     # First try direct import
-    try:
-        import fusionscript as script_module
+    script_module = _import_fusionscript()
+    if script_module is not None:
         logging.info("Successfully imported fusionscript module directly.")
         return script_module
-    except ImportError as e:
-        logging.warning("Could not directly import fusionscript: %s", e)
-    
-    # Next try adding Resolve scripting module paths to Python path
-    module_paths = [
-        os.path.join(os.environ.get('PROGRAMDATA', 'C:\\ProgramData'), 
-                     "Blackmagic Design\\DaVinci Resolve\\Support\\Developer\\Scripting\\Modules"),
-        "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",  # macOS
-        "/opt/resolve/Developer/Scripting/Modules"  # Linux
-    ]
-    
-    for path in module_paths:
-        if os.path.exists(path) and path not in sys.path:
-            sys.path.append(path)
-            logging.info("Added %s to Python path", path)
+    logging.warning("Could not directly import fusionscript.")
     
-    # Try import again after path additions
-    try:
-        import fusionscript as script_module
-        logging.info("Successfully imported fusionscript after adding module paths.")
+    # Next look in the Resolve scripting module directories; PathFinder searches only
+    # these, without walking every meta-path finder or touching sys.path
+    module_dirs = [path for path in _MODULE_PATHS if _is_dir(path)]
+    script_module = _import_from_dirs("fusionscript", module_dirs) if module_dirs else None
+    if script_module is not None:
+        logging.info("Successfully imported fusionscript from the Resolve module paths.")
         return script_module
-    except ImportError:
-        logging.warning("Still could not import fusionscript after adding module paths.")
+    logging.warning("Still could not import fusionscript from the Resolve module paths.")
     
-    # As a last resort, try dynamic loading with potential paths
+    # As a last resort, try dynamic loading with potential paths; on Windows the
+    # library's dependencies are found through PATH, so set that up first
+    _ensure_resolve_on_path()
     fusion_paths = get_fusion_script_paths()
     for path in fusion_paths:
-        if os.path.exists(path):
+        # Directories are rejected here rather than failing later inside load_dynamic
+        if _is_file(path):
             logging.info("Found fusionscript at: %s", path)
             try:
                 script_module = load_dynamic("fusionscript", path)
@@ -89,23 +172,58 @@ def load_resolve_script():
                 logging.warning("Failed to load %s: %s", path, e)
     
     logging.critical("Could not locate fusionscript module. Ensure DaVinci Resolve is installed.")
+    # Forget the negative probes so a later search sees a fresh install
+    _stat_mode.cache_clear()
+    _dir_files.cache_clear()
     return None
 
+def _import_fusionscript():
+    """Import fusionscript if it is importable, without raising ImportError for a plain miss."""
+    # find_spec answers "not found" with None, so a miss costs no exception and traceback
+    if importlib.util.find_spec("fusionscript") is None:
+        return None
+    try:
+        return importlib.import_module("fusionscript")
+    except ImportError as e:
+        # Found but failed to initialise (e.g. a missing dependent library)
+        logging.warning("fusionscript was found but could not be imported: %s", e)
+        return None
+
+def _import_from_dirs(module_name, directories):
+    """Import module_name from the given directories only; None if it isn't there."""
+    spec = importlib.machinery.PathFinder.find_spec(module_name, directories)
+    if spec is None:
+        return None
+    # An extension module's library is loaded inside module_from_spec, so that belongs in the try too
+    try:
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    except Exception as e:
+        sys.modules.pop(module_name, None)
+        logging.warning("%s was found but could not be imported: %s", module_name, e)
+        return None
+    return module
+
 def load_dynamic(module_name, file_path):
-    """Load a dynamic module (.dll/.so) based on Python version."""
-    if sys.version_info[0] >= 3 and sys.version_info[1] >= 5:
-        import importlib.machinery
-        import importlib.util
-        
-        module = None
-        loader = importlib.machinery.ExtensionFileLoader(module_name, file_path)
-        if loader:
-            spec = importlib.util.spec_from_loader(module_name, loader)
-            if spec:
-                module = importlib.util.module_from_spec(spec)
-                if module:
-                    loader.exec_module(module)
+    """Load a dynamic module (.dll/.so) from an explicit file path, once per name and file."""
+    try:
+        st = os.stat(file_path)
+    except OSError as e:
+        raise ImportError(f"Cannot load {module_name} from {file_path}: {e}") from e
+    # Key by device/inode like CPython's own dlopen handle cache, so symlinked paths
+    # share one load; fall back to the resolved path where no inode is reported
+    file_id = (st.st_dev, st.st_ino) if st.st_ino else os.path.realpath(file_path)
+    key = (module_name, file_id)
+    module = _DYNAMIC_MODULES.get(key)
+    if module is not None:
         return module
-    else:
-        import imp
-        return imp.load_dynamic(module_name, file_path)
\ No newline at end of file
+
+    loader = importlib.machinery.ExtensionFileLoader(module_name, file_path)
+    spec = importlib.util.spec_from_loader(module_name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    # Register it so later imports and lookups by name reuse this module
+    sys.modules[module_name] = module
+    _DYNAMIC_MODULES[key] = module
+    return module
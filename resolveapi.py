@@ -1,7 +1,10 @@
 import sys
 
 # Adjust path to point to your Resolve Scripting Modules if needed:
-sys.path.append("C:\\ProgramData\\Blackmagic Design\\DaVinci Resolve\\Support\\Developer\\Scripting\\Modules")
+RESOLVE_MODULES = "C:\\ProgramData\\Blackmagic Design\\DaVinci Resolve\\Support\\Developer\\Scripting\\Modules"
+# Insert once, at the front, so repeated runs don't grow sys.path and the module is found first
+if RESOLVE_MODULES not in sys.path:
+    sys.path.insert(0, RESOLVE_MODULES)
 
 try:
     import DaVinciResolveScript as dvr
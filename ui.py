@@ -1,47 +1,118 @@
 import os
 import json
+import queue
 import logging
+from collections import deque
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QGridLayout, QFrame, QProgressBar, QDialog, QDialogButtonBox,
     QComboBox, QFormLayout, QCheckBox, QMessageBox, QSpinBox,
     QScrollArea, QMenuBar, QMenu
 )
-from PyQt6.QtGui import QDrag, QAction
-from PyQt6.QtCore import QMimeData, Qt, QUrl, QThread, QPoint
+from PyQt6.QtGui import QDrag, QAction, QPixmapCache
+from PyQt6.QtCore import QMimeData, Qt, QUrl, QThread, QThreadPool, QPoint, QSettings, QTimer, QEvent
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
 from config import DEFAULT_SETTINGS
 from backend import ResolveController
-from workers import AIWorker, SceneDetectionWorker, ExportWorker, BatchExportWorker
+from workers import (
+    AIWorker, SceneDetectionWorker, ImportProducerWorker, ImportSignals, ImportTask,
+    TimelineUpdateWorker, ExportWorker, BatchExportPool
+)
+
+# Imported items buffered between the import producer and scene detection
+SCENE_PIPELINE_DEPTH = 4
+# Detected segments buffered between scene detection and the timeline update
+SEGMENT_QUEUE_DEPTH = 64
+# Quiet period (ms) before the export size estimate is recomputed after a change
+ESTIMATE_DEBOUNCE_MS = 50
+# Dark theme applied once to the QApplication; widgets opt in through their objectName
+STYLE_SHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dark.qss")
+# Video file extensions accepted by drag & drop
+_SUPPORTED_EXTS = frozenset({".mp4", ".mov", ".avi"})
+# Idle media players kept for reuse by whichever preview is hovered next
+PLAYER_POOL_SIZE = 3
+
+def load_style_sheet(path=STYLE_SHEET_PATH):
+    """Read the application stylesheet, or return "" (Qt's default look) if it can't be read."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError as e:
+        logging.warning("Could not load stylesheet %s: %s", path, e)
+        return ""
+
+class SettingsStore:
+    """User settings persisted with QSettings, cached in memory after the first read."""
+    _instance = None
+
+    def __init__(self, organization="DavinciAI", application="DroneVideoEditor"):
+        self._qsettings = QSettings(organization, application)
+        self._cache = {}
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def value(self, key, default=None):
+        if key not in self._cache:
+            # Stored as JSON so bools and custom resolution dicts keep their types on every backend
+            raw = self._qsettings.value(key)
+            try:
+                self._cache[key] = default if raw is None else json.loads(raw)
+            except (TypeError, ValueError):
+                logging.warning("Ignoring unreadable stored setting '%s'", key)
+                self._cache[key] = default
+        return self._cache[key]
+
+    def setValue(self, key, value):
+        self._cache[key] = value
+        self._qsettings.setValue(key, json.dumps(value))
+
+    def update(self, settings):
+        for key, value in settings.items():
+            self.setValue(key, value)
+
+    def settings(self, defaults=DEFAULT_SETTINGS):
+        """Return the stored settings as a dict, falling back to defaults for unset keys."""
+        return {key: self.value(key, default) for key, default in defaults.items()}
+
+    def geometry(self):
+        return self._qsettings.value("window/geometry")
+
+    def setGeometry(self, geometry):
+        self._qsettings.setValue("window/geometry", geometry)
 
-# Settings Dialog (unchanged)
 class SettingsDialog(QDialog):
     def __init__(self, current_settings, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.resize(300, 400)
-        self.settings = current_settings.copy()
 
         layout = QFormLayout(self)
 
         self.ai_level_combo = QComboBox(self)
         self.ai_level_combo.addItems(["Low", "Medium", "High"])
-        self.ai_level_combo.setCurrentText(self.settings.get("ai_processing_level", "Medium"))
+        self.ai_level_combo.setCurrentText(
+            current_settings.get("ai_processing_level", DEFAULT_SETTINGS["ai_processing_level"])
+        )
         layout.addRow("AI Processing Level:", self.ai_level_combo)
 
         self.lut_combo = QComboBox(self)
         self.lut_combo.addItems(["Default", "Cinematic", "Vintage"])
-        self.lut_combo.setCurrentText(self.settings.get("lut_selection", "Default"))
+        self.lut_combo.setCurrentText(current_settings.get("lut_selection", DEFAULT_SETTINGS["lut_selection"]))
         layout.addRow("LUT Selection:", self.lut_combo)
 
+        resolution = current_settings.get("export_resolution", DEFAULT_SETTINGS["export_resolution"])
         self.resolution_combo = QComboBox(self)
         self.resolution_combo.addItems(["1080p", "4K", "8K"])
-        if isinstance(self.settings.get("export_resolution"), dict):
+        if isinstance(resolution, dict):
             self.resolution_combo.setCurrentText("1080p")
         else:
-            self.resolution_combo.setCurrentText(self.settings.get("export_resolution", "1080p"))
+            self.resolution_combo.setCurrentText(resolution)
         layout.addRow("Export Resolution Preset:", self.resolution_combo)
 
         self.custom_resolution_checkbox = QCheckBox("Use Custom Resolution", self)
@@ -66,20 +137,24 @@ class SettingsDialog(QDialog):
                 self.height_spinbox.setEnabled(checked)
             )
         )
+        if isinstance(resolution, dict):
+            self.width_spinbox.setValue(resolution.get("width", 1920))
+            self.height_spinbox.setValue(resolution.get("height", 1080))
+            self.custom_resolution_checkbox.setChecked(True)
 
         audio_header = QLabel("Audio Enhancements", self)
-        audio_header.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        audio_header.setObjectName("sectionHeader")
         layout.addRow(audio_header)
         self.auto_volume_checkbox = QCheckBox("Auto Volume Balancing", self)
-        self.auto_volume_checkbox.setChecked(self.settings.get("auto_volume", False))
+        self.auto_volume_checkbox.setChecked(current_settings.get("auto_volume", DEFAULT_SETTINGS["auto_volume"]))
         layout.addRow("", self.auto_volume_checkbox)
         self.noise_gate_checkbox = QCheckBox("Noise Gate & EQ Adjustments", self)
-        self.noise_gate_checkbox.setChecked(self.settings.get("noise_gate_eq", False))
+        self.noise_gate_checkbox.setChecked(current_settings.get("noise_gate_eq", DEFAULT_SETTINGS["noise_gate_eq"]))
         layout.addRow("", self.noise_gate_checkbox)
 
         self.music_combo = QComboBox(self)
         self.music_combo.addItems(["None", "Track 1", "Track 2", "Track 3"])
-        self.music_combo.setCurrentText(self.settings.get("music_selection", "None"))
+        self.music_combo.setCurrentText(current_settings.get("music_selection", DEFAULT_SETTINGS["music_selection"]))
         layout.addRow("Music Selection:", self.music_combo)
 
         self.buttonBox = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -104,6 +179,20 @@ class SettingsDialog(QDialog):
 
 # Export Dialog (unchanged)
 class ExportDialog(QDialog):
+    # Named export resolutions and rough per-clip output sizes (MB at 1080p) for the estimate
+    PRESETS = {
+        "1080p": (1920, 1080),
+        "4K": (3840, 2160),
+        "8K": (7680, 4320)
+    }
+    BASE_SIZES = {
+        "MP4": 5,
+        "MOV": 6,
+        "AVI": 5.5,
+        "ProRes": 7,
+        "H.265": 4
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Export Settings")
@@ -127,6 +216,18 @@ class ExportDialog(QDialog):
         self.batch_export_checkbox = QCheckBox("Batch Export Clips", self)
         layout.addRow("", self.batch_export_checkbox)
 
+        self.parallel_spinbox = QSpinBox(self)
+        self.parallel_spinbox.setRange(1, os.cpu_count() or 1)
+        self.parallel_spinbox.setValue(min(2, self.parallel_spinbox.maximum()))
+        self.parallel_spinbox.setEnabled(False)
+        self.batch_export_checkbox.toggled.connect(self.parallel_spinbox.setEnabled)
+        layout.addRow("Parallel Exports:", self.parallel_spinbox)
+
+        self.background_priority_checkbox = QCheckBox("Background Export Priority", self)
+        self.background_priority_checkbox.setChecked(True)
+        self.background_priority_checkbox.setToolTip("Run export work below normal priority so the editor stays responsive")
+        layout.addRow("", self.background_priority_checkbox)
+
         self.watermark_checkbox = QCheckBox("Apply Watermark", self)
         layout.addRow("", self.watermark_checkbox)
         watermark_layout = QHBoxLayout()
@@ -137,19 +238,47 @@ class ExportDialog(QDialog):
         watermark_layout.addWidget(self.watermark_label)
         layout.addRow("Watermark:", watermark_layout)
 
-        self.format_combo.currentTextChanged.connect(self.updateEstimate)
+        # Rapid format flips and clip count changes collapse into one recompute
+        self._estimate_timer = QTimer(self)
+        self._estimate_timer.setSingleShot(True)
+        self._estimate_timer.setInterval(ESTIMATE_DEBOUNCE_MS)
+        self._estimate_timer.timeout.connect(lambda: self.updateEstimate(self.format_combo.currentText()))
+        self.format_combo.currentTextChanged.connect(lambda _: self._estimate_timer.start())
 
         self.buttonBox = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         self.buttonBox.accepted.connect(self.accept)
         self.buttonBox.rejected.connect(self.reject)
         layout.addWidget(self.buttonBox)
 
+        # The estimate's inputs only change with the parent's clips/settings, not per format change
+        self._refreshEstimateInputs()
         self.updateEstimate(self.format_combo.currentText())
 
+    def _refreshEstimateInputs(self):
+        """Cache the clip count and pixel ratio (vs 1080p) that updateEstimate scales by."""
+        parent = self.parent()
+        resolution = "1080p"
+        if parent and hasattr(parent, 'settings'):
+            resolution = parent.settings.get("export_resolution", "1080p")
+        if isinstance(resolution, dict):
+            width = resolution.get("width", 1920)
+            height = resolution.get("height", 1080)
+        else:
+            width, height = self.PRESETS.get(resolution, (1920, 1080))
+        self._pixel_ratio = (width * height) / (1920 * 1080)
+        self._num_clips = 1
+        if parent and hasattr(parent, 'preview_widgets'):
+            self._num_clips = len(parent.preview_widgets) or 1
+
+    def setClipCount(self, num_clips):
+        self._num_clips = num_clips or 1
+        self._estimate_timer.start()
+
     def selectDirectory(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Export Directory", os.getcwd())
         if directory:
             self.directory_label.setText(directory)
+            self._refreshEstimateInputs()
             self.updateEstimate(self.format_combo.currentText())
 
     def selectWatermark(self):
@@ -158,104 +287,103 @@ class ExportDialog(QDialog):
             self.watermark_label.setText(file_path)
 
     def updateEstimate(self, fmt):
-        resolution = "1080p"
-        if self.parent() and hasattr(self.parent(), 'settings'):
-            resolution = self.parent().settings.get("export_resolution", "1080p")
-        if isinstance(resolution, dict):
-            width = resolution.get("width", 1920)
-            height = resolution.get("height", 1080)
-        else:
-            presets = {
-                "1080p": (1920, 1080),
-                "4K": (3840, 2160),
-                "8K": (7680, 4320)
-            }
-            width, height = presets.get(resolution, (1920, 1080))
-        num_clips = 1
-        if self.parent() and hasattr(self.parent(), 'preview_widgets'):
-            num_clips = len(self.parent().preview_widgets) or 1
-        base_sizes = {
-            "MP4": 5,
-            "MOV": 6,
-            "AVI": 5.5,
-            "ProRes": 7,
-            "H.265": 4
-        }
-        base_size = base_sizes.get(fmt, 5)
-        est_size = num_clips * base_size * (width * height) / (1920 * 1080)
+        est_size = self._num_clips * self.BASE_SIZES.get(fmt, 5) * self._pixel_ratio
         self.size_label.setText(f"Estimated Size: {est_size:.1f} MB")
 
     def getExportSettings(self):
+        if self._estimate_timer.isActive():
+            # Flush a pending recompute so the reported estimate matches the chosen format
+            self._estimate_timer.stop()
+            self.updateEstimate(self.format_combo.currentText())
         return {
             "export_format": self.format_combo.currentText(),
             "estimated_size": self.size_label.text().split(": ")[1],
             "export_location": self.directory_label.text(),
             "batch_export": self.batch_export_checkbox.isChecked(),
+            "parallel_exports": self.parallel_spinbox.value(),
+            "background_priority": self.background_priority_checkbox.isChecked(),
             "watermark": self.watermark_label.text() if self.watermark_checkbox.isChecked() else None
         }
 
 # Video Preview Widget (unchanged)
 class VideoPreviewWidget(QFrame):
+    # Shared (QMediaPlayer, QAudioOutput, QVideoWidget) triples; only hovered previews hold one
+    _player_pool = deque(maxlen=PLAYER_POOL_SIZE)
+
     def __init__(self, file_path, parent=None):
         super().__init__(parent)
         self.file_path = file_path
         self.setFixedSize(150, 100)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #506680;
-                border-radius: 10px;
-            }
-        """)
+        self.setObjectName("clipPreview")
         self.setAcceptDrops(True)
         self._drag_start_position = None
+        # Grabbed on the first drag and reused; QPixmapCache shares it with later widgets for the same file
+        self._drag_pixmap = None
 
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
 
-        self.video_widget = QVideoWidget()
-        self.video_widget.setFixedSize(150, 100)
-
-        self.media_player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.media_player.setAudioOutput(self.audio_output)
-        self.audio_output.setVolume(0)
-        self.media_player.setVideoOutput(self.video_widget)
-        self.media_player.setSource(QUrl.fromLocalFile(file_path))
-
-        self.layout.addWidget(self.video_widget)
+        # Shown until the clip is hovered and a pooled player takes its place
+        self.placeholder = QLabel(os.path.basename(file_path), self)
+        self.placeholder.setFixedSize(150, 100)
+        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder.setWordWrap(True)
+        self.placeholder.setObjectName("clipPlaceholder")
+        self.layout.addWidget(self.placeholder)
+        self._player = None
 
         self.remove_button = QPushButton("×", self)
         self.remove_button.setFixedSize(20, 20)
-        self.remove_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF0000;
-                color: white;
-                font-weight: bold;
-                border-radius: 10px;
-                font-size: 16px;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #CC0000;
-            }
-        """)
+        self.remove_button.setObjectName("removeClipBtn")
         self.remove_button.setToolTip("Remove this clip")
         self.remove_button.move(125, 5)
 
         self.enterEvent = self.on_mouse_enter
         self.leaveEvent = self.on_mouse_leave
 
+    @classmethod
+    def _acquire_player(cls):
+        if cls._player_pool:
+            return cls._player_pool.pop()
+        media_player = QMediaPlayer()
+        audio_output = QAudioOutput()
+        audio_output.setVolume(0)
+        media_player.setAudioOutput(audio_output)
+        video_widget = QVideoWidget()
+        video_widget.setFixedSize(150, 100)
+        media_player.setVideoOutput(video_widget)
+        return media_player, audio_output, video_widget
+
+    def _release_player(self):
+        if self._player is None:
+            return
+        media_player, audio_output, video_widget = self._player
+        self._player = None
+        media_player.stop()
+        media_player.setSource(QUrl())
+        self.layout.removeWidget(video_widget)
+        video_widget.hide()
+        video_widget.setParent(None)
+        self.placeholder.show()
+        self._player_pool.append((media_player, audio_output, video_widget))
+
     def on_mouse_enter(self, event):
-        self.media_player.play()
+        if self._player is None:
+            self._player = self._acquire_player()
+            media_player, _, video_widget = self._player
+            media_player.setSource(QUrl.fromLocalFile(self.file_path))
+            self.placeholder.hide()
+            self.layout.addWidget(video_widget)
+            video_widget.show()
+            self.remove_button.raise_()
+        self._player[0].play()
 
     def on_mouse_leave(self, event):
-        self.media_player.pause()
-        self.media_player.setPosition(0)
+        self._release_player()
 
     def cleanup(self):
-        self.media_player.stop()
-        self.media_player = None
+        self._release_player()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -269,14 +397,27 @@ class VideoPreviewWidget(QFrame):
                 mimeData = QMimeData()
                 mimeData.setData("application/x-clipwidget", b"")
                 drag.setMimeData(mimeData)
-                pixmap = self.grab()
-                drag.setPixmap(pixmap)
+                drag.setPixmap(self._dragPixmap())
                 main_window = self.window()
                 if hasattr(main_window, 'drag_source'):
                     main_window.drag_source = self
                 drag.exec()
         super().mouseMoveEvent(event)
 
+    def _dragPixmap(self):
+        if self._drag_pixmap is None:
+            cache_key = "drag:" + self.file_path
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is None or pixmap.size() != self.size():
+                pixmap = self.grab()
+                QPixmapCache.insert(cache_key, pixmap)
+            self._drag_pixmap = pixmap
+        return self._drag_pixmap
+
+    def resizeEvent(self, event):
+        self._drag_pixmap = None
+        super().resizeEvent(event)
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasFormat("application/x-clipwidget"):
             event.acceptProposedAction()
@@ -292,45 +433,69 @@ class DroneVideoEditor(QMainWindow):
     def __init__(self, backend, settings):
         super().__init__()
         self.backend = backend
-        self.settings = settings.copy()
+        # settings supplies the defaults; saved values from earlier sessions take precedence
+        self._settings_store = SettingsStore.instance()
+        self._default_settings = settings
+        # Settings from a loaded project file; they apply for this session only and are never saved
+        self._project_settings = {}
+        # Media Pool imports run on pool threads; results come back to the GUI thread as queued signals
+        self._import_pool = QThreadPool.globalInstance()
+        self._import_signals = ImportSignals(self)
+        self._import_signals.imported.connect(self._onMediaImported)
+        self._import_signals.failed.connect(self._onImportFailed)
+        # ImportTasks started but not yet reported back; actions that use imported_items wait for zero
+        self._pending_imports = 0
         self.preview_widgets = []
+        # AI operations share one pool; in-flight workers are kept here with their last progress
+        self._ai_pool = QThreadPool(self)
+        self._ai_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
+        self._ai_progress = {}
         self.imported_items = []  # Contains valid MediaPoolItem objects
         self.drag_source = None
         self.clip_count = 0
+        # The open ExportDialog, if any, so clip count changes reach its size estimate
+        self._export_dialog = None
+        # Kept in sync by changeEvent so toggleMaximize needn't query the window state
         self.is_maximized = False
         # For dragging the window around:
         self.dragPos = QPoint()
 
         self.initUI()
+        geometry = self._settings_store.geometry()
+        if geometry:
+            self.restoreGeometry(geometry)
+
+    @property
+    def settings(self):
+        settings = self._settings_store.settings(self._default_settings)
+        settings.update(self._project_settings)
+        return settings
+
+    def _setting(self, key, default=None):
+        if key in self._project_settings:
+            return self._project_settings[key]
+        return self._settings_store.value(key, default)
+
+    def closeEvent(self, event):
+        self._settings_store.setGeometry(self.saveGeometry())
+        super().closeEvent(event)
 
     def createStyledButton(self, text, function):
         button = QPushButton(text, self)
         button.clicked.connect(function)
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #404040;
-                border-radius: 5px;
-                padding: 8px;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
+        button.setObjectName("primaryBtn")
         return button
 
     def initUI(self):
         self.setWindowTitle("Drone Video Editor")
         self.setGeometry(100, 100, 800, 600)
-        self.setStyleSheet("QMainWindow { background-color: #1E1E1E; color: #ffffff; font-size: 14px; }")
 
         # Remove the OS title bar:
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.FramelessWindowHint)
 
         # --- Create a custom top-bar that holds the QMenuBar + Window Control Buttons ---
         top_bar = QWidget(self)
-        top_bar.setStyleSheet("background-color: #282828;")
+        top_bar.setObjectName("topBar")
         top_bar_layout = QHBoxLayout(top_bar)
         top_bar_layout.setContentsMargins(0, 0, 0, 0)
         top_bar_layout.setSpacing(0)
@@ -341,13 +506,6 @@ class DroneVideoEditor(QMainWindow):
 
         # Create the QMenuBar (manually, so we can place it in our layout)
         menubar = QMenuBar(self)
-        menubar.setStyleSheet("""
-            QMenuBar { background-color: #282828; color: #ffffff; }
-            QMenuBar::item { background-color: #282828; color: #ffffff; padding: 5px 15px; }
-            QMenuBar::item:selected { background-color: #505050; }
-            QMenu { background-color: #282828; color: #ffffff; }
-            QMenu::item:selected { background-color: #505050; }
-        """)
 
         # File Menu
         file_menu = menubar.addMenu("File")
@@ -394,46 +552,19 @@ class DroneVideoEditor(QMainWindow):
         # --- Window Control Buttons ---
         btn_minimize = QPushButton("—", self)
         btn_minimize.setFixedSize(40, 28)
-        btn_minimize.setStyleSheet("""
-            QPushButton {
-                background-color: #282828;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
+        btn_minimize.setObjectName("windowControl")
         btn_minimize.clicked.connect(self.showMinimized)
         top_bar_layout.addWidget(btn_minimize)
 
         btn_maximize = QPushButton("□", self)
         btn_maximize.setFixedSize(40, 28)
-        btn_maximize.setStyleSheet("""
-            QPushButton {
-                background-color: #282828;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
+        btn_maximize.setObjectName("windowControl")
         btn_maximize.clicked.connect(self.toggleMaximize)
         top_bar_layout.addWidget(btn_maximize)
 
         btn_close = QPushButton("×", self)
         btn_close.setFixedSize(40, 28)
-        btn_close.setStyleSheet("""
-            QPushButton {
-                background-color: #282828;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #FF4444;
-            }
-        """)
+        btn_close.setObjectName("windowClose")
         btn_close.clicked.connect(self.close)
         top_bar_layout.addWidget(btn_close)
 
@@ -449,20 +580,13 @@ class DroneVideoEditor(QMainWindow):
 
         # Drag & Drop Area
         self.drop_area = QFrame(self)
-        self.drop_area.setStyleSheet("""
-            QFrame { 
-                background-color: #2C2C2C; 
-                border: 2px dashed #555; 
-                border-radius: 10px;
-                margin: 5px 0;
-            }
-        """)
+        self.drop_area.setObjectName("dropArea")
         self.drop_area.setAcceptDrops(True)
         self.drop_area.setMinimumHeight(140)
         self.drop_area_layout = QVBoxLayout(self.drop_area)
         self.drop_area_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.plus_label = QLabel("+\nDrag & Drop Footage\nor use File > Import", self.drop_area)
-        self.plus_label.setStyleSheet("font-size: 24px; color: #777;")
+        self.plus_label.setObjectName("dropHint")
         self.plus_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.drop_area_layout.addWidget(self.plus_label)
         main_layout.addWidget(self.drop_area)
@@ -507,20 +631,8 @@ class DroneVideoEditor(QMainWindow):
         export_layout = QHBoxLayout()
         self.export_button = self.createStyledButton("Export Video", self.exportVideo)
         self.export_button.setFixedWidth(300)
-        # Updated export button style (flat dark gray with hover)
-        self.export_button.setStyleSheet("""
-            QPushButton {
-                background-color: #404040;
-                border-radius: 5px;
-                padding: 16px;
-                font-weight: bold;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
+        # Larger, bold variant of the styled button (flat dark gray with hover)
+        self.export_button.setObjectName("exportBtn")
         export_layout.addStretch()
         export_layout.addWidget(self.export_button)
         export_layout.addStretch()
@@ -539,11 +651,16 @@ class DroneVideoEditor(QMainWindow):
 
     def toggleMaximize(self):
         # Simple approach: if not maximized, maximize; else restore
-        if not self.isMaximized():
+        if not self.is_maximized:
             self.showMaximized()
         else:
             self.showNormal()
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.is_maximized = bool(self.windowState() & Qt.WindowState.WindowMaximized)
+        super().changeEvent(event)
+
     def importFootage(self):
         try:
             file_paths, _ = QFileDialog.getOpenFileNames(
@@ -551,41 +668,62 @@ class DroneVideoEditor(QMainWindow):
                 "Video Files (*.mp4 *.mov *.avi)"
             )
             if file_paths:
-                new_items = self.backend.import_media(file_paths)
-                if new_items:
-                    for item in new_items:
-                        try:
-                            logging.info("Imported item type: %s, name: %s", type(item),
-                                         item.GetName() if hasattr(item, "GetName") else "Unknown")
-                        except Exception as e:
-                            logging.warning("Error retrieving name for item: %s", e)
-                    self.imported_items.extend(new_items)
-                else:
-                    logging.info("No new media items imported.")
-                for file_path in file_paths:
-                    self.addClipPreview(file_path)
+                self.addClipPreviews(file_paths)
+                self._startImport(file_paths)
             else:
                 logging.info("Import cancelled or no files selected.")
         except Exception as e:
             logging.exception("Error importing footage: %s", e)
             QMessageBox.critical(self, "Import Error", "An error occurred while importing footage.")
 
+    def _startImport(self, file_paths):
+        self._pending_imports += 1
+        self._import_pool.start(ImportTask(self.backend, file_paths, self._import_signals))
+
+    def _importsPending(self):
+        """Tell the user and return True while media is still being imported into Resolve."""
+        if self._pending_imports:
+            logging.info("%d import(s) still in progress.", self._pending_imports)
+            QMessageBox.information(self, "Import In Progress",
+                                    "Footage is still being imported into Resolve. Please try again when it finishes.")
+            return True
+        return False
+
+    def _onMediaImported(self, new_items):
+        self._pending_imports -= 1
+        if not new_items:
+            logging.info("No new media items imported.")
+            return
+        for item in new_items:
+            try:
+                logging.info("Imported item type: %s, name: %s", type(item),
+                             item.GetName() if hasattr(item, "GetName") else "Unknown")
+            except Exception as e:
+                logging.warning("Error retrieving name for item: %s", e)
+        self.imported_items.extend(new_items)
+
+    def _onImportFailed(self, message):
+        self._pending_imports -= 1
+        QMessageBox.critical(self, "Import Error", "An error occurred while importing footage.")
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
 
     def dropEvent(self, event):
         try:
+            file_paths = []
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.mp4', '.mov', '.avi')):
-                    new_items = self.backend.import_media([file_path])
-                    if new_items:
-                        self.imported_items.extend(new_items)
-                    self.addClipPreview(file_path)
+                if os.path.splitext(file_path)[1].lower() in _SUPPORTED_EXTS:
+                    file_paths.append(file_path)
                 else:
                     logging.warning("Unsupported file type dropped: %s", file_path)
                     QMessageBox.warning(self, "Unsupported File", f"File '{file_path}' is not a supported video format.")
+            # The whole drop goes to Resolve in one import call
+            if file_paths:
+                self.addClipPreviews(file_paths)
+                self._startImport(file_paths)
         except Exception as e:
             logging.exception("Error during file drop: %s", e)
 
@@ -594,6 +732,8 @@ class DroneVideoEditor(QMainWindow):
             logging.warning("No clips available to create a timeline.")
             QMessageBox.information(self, "No Clips", "Please import clips before creating a timeline.")
             return
+        if self._importsPending():
+            return
         if not self.imported_items:
             logging.warning("No imported items in the Media Pool.")
             QMessageBox.warning(self, "Timeline Error", "No media items found in the Media Pool.")
@@ -611,24 +751,36 @@ class DroneVideoEditor(QMainWindow):
             logging.warning("No clips to process for %s.", operation)
             return
         self.progress_bar.show()
-        self.progress_bar.setValue(0)
-        self.thread = QThread()
-        self.worker = AIWorker(operation, num_clips)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.worker.finished.connect(lambda: logging.info("Finished %s on %d clip(s).", operation, num_clips))
-        self.worker.finished.connect(lambda: self.progress_bar.hide())
-        self.thread.start()
+        worker = AIWorker(operation, num_clips)
+        self._ai_progress[worker] = 0
+        self._updateAIProgress()
+        worker.signals.progress.connect(lambda pct: self._onAIProgress(worker, pct))
+        worker.signals.finished.connect(lambda: self._onAIFinished(worker))
+        self._ai_pool.start(worker)
+
+    def _updateAIProgress(self):
+        # With several operations in flight, show the least complete one
+        self.progress_bar.setValue(min(self._ai_progress.values()))
+
+    def _onAIProgress(self, worker, percent):
+        if worker in self._ai_progress:
+            self._ai_progress[worker] = percent
+            self._updateAIProgress()
+
+    def _onAIFinished(self, worker):
+        self._ai_progress.pop(worker, None)
+        logging.info("Finished %s on %d clip(s).", worker.operation, worker.num_clips)
+        if self._ai_progress:
+            self._updateAIProgress()
+        else:
+            self.progress_bar.hide()
 
     def autoColorGrade(self):
-        lut_name = self.settings.get("lut_selection", "Default")
+        lut_name = self._setting("lut_selection", "Default")
         if lut_name != "Default":
+            # Answered from the backend's startup LUT directory scan, so no stat per click
             lut_path = self.getLUTPath(lut_name)
-            if lut_path and os.path.exists(lut_path):
+            if lut_path:
                 self.backend.apply_lut(lut_path)
             else:
                 logging.error("LUT file for '%s' not found.", lut_name)
@@ -638,8 +790,22 @@ class DroneVideoEditor(QMainWindow):
         self.runAITask("AI Smart Reframe")
 
     def detectScenes(self):
-        # --- KEY CHANGE: If imported_items is empty, try to fetch from current timeline.
-        if not self.imported_items:
+        # Otherwise the previews of an in-flight import would look unimported and be imported twice
+        if self._importsPending():
+            return
+        items = self.imported_items
+        total_items = None
+        producer = None
+        pending_files = [widget.file_path for widget in self.preview_widgets]
+        if not items and pending_files:
+            # Previewed clips not yet in the Media Pool (e.g. after Load Project): import them
+            # on one thread while scene detection consumes each item as soon as it lands
+            logging.info("Importing %d clip(s) while detecting scenes.", len(pending_files))
+            items = queue.Queue(maxsize=SCENE_PIPELINE_DEPTH)
+            total_items = len(pending_files)
+            producer = ImportProducerWorker(self.backend, pending_files, items)
+        elif not items:
+            # --- KEY CHANGE: If imported_items is empty, try to fetch from current timeline.
             logging.warning("No clips available for scene detection.")
             # Attempt to gather from the current timeline:
             timeline = self.backend.get_current_timeline()
@@ -647,7 +813,22 @@ class DroneVideoEditor(QMainWindow):
                 timeline_clips = timeline.GetItemListInTrack("video", 1)
                 if timeline_clips:
                     logging.info("Detected %d clip(s) from existing timeline.", len(timeline_clips))
-                    self.imported_items.extend(timeline_clips)
+                    # Resolve every source clip now: the timeline update clears this track, and
+                    # a TimelineItem deleted before the worker reaches it has no MediaPoolItem left
+                    items = []
+                    for timeline_item in timeline_clips:
+                        try:
+                            media_pool_item = timeline_item.GetMediaPoolItem()
+                        except Exception as e:
+                            logging.warning("Error calling GetMediaPoolItem: %s", e)
+                            media_pool_item = None
+                        if media_pool_item:
+                            items.append(media_pool_item)
+                        else:
+                            logging.warning("Skipping timeline item with no associated MediaPoolItem.")
+                    if not items:
+                        QMessageBox.warning(self, "No Clips", "No clips in the current Resolve timeline have source media.")
+                        return
                 else:
                     QMessageBox.warning(self, "No Clips", "No clips are found in the current Resolve timeline.")
                     return
@@ -657,19 +838,52 @@ class DroneVideoEditor(QMainWindow):
 
         self.progress_bar.show()
         self.progress_bar.setValue(0)
+        # Segments go from scene detection to the timeline update as they are found and are
+        # appended in batches; the bounded queue keeps detection from running far ahead
+        segments = queue.Queue(maxsize=SEGMENT_QUEUE_DEPTH)
+        self.timeline_thread = QThread()
+        self.timeline_worker = TimelineUpdateWorker(self.backend, segments)
+        self.timeline_worker.moveToThread(self.timeline_thread)
+        self.timeline_thread.started.connect(self.timeline_worker.run)
+        self.timeline_worker.finished.connect(self.onSceneDetectionFinished)
+        self.timeline_worker.finished.connect(self.timeline_thread.quit)
+        self.timeline_worker.finished.connect(self.timeline_worker.deleteLater)
+        self.timeline_thread.finished.connect(self.timeline_thread.deleteLater)
+
         self.scene_thread = QThread()
-        self.scene_worker = SceneDetectionWorker(self.imported_items)
+        self.scene_worker = SceneDetectionWorker(items, segments, total_items)
         self.scene_worker.moveToThread(self.scene_thread)
         self.scene_thread.started.connect(self.scene_worker.run)
-        self.scene_worker.progress.connect(self.progress_bar.setValue)
-        self.scene_worker.finished.connect(self.onSceneDetectionFinished)
+        self.scene_worker.finished.connect(self.scene_thread.quit)
         self.scene_worker.finished.connect(self.scene_worker.deleteLater)
         self.scene_thread.finished.connect(self.scene_thread.deleteLater)
+
+        if producer is None:
+            self.scene_worker.progress.connect(self.progress_bar.setValue)
+        else:
+            # Report the slower stage so the bar never runs ahead of either one
+            self._pipeline_progress = [0, 0]
+            producer.progress.connect(lambda pct: self._onPipelineProgress(0, pct))
+            self.scene_worker.progress.connect(lambda pct: self._onPipelineProgress(1, pct))
+            producer.imported.connect(self.imported_items.extend)
+            self.import_thread = QThread()
+            self.import_worker = producer
+            producer.moveToThread(self.import_thread)
+            self.import_thread.started.connect(producer.run)
+            producer.finished.connect(self.import_thread.quit)
+            producer.finished.connect(producer.deleteLater)
+            self.import_thread.finished.connect(self.import_thread.deleteLater)
+            self.import_thread.start()
+
+        self.timeline_thread.start()
         self.scene_thread.start()
 
-    def onSceneDetectionFinished(self, new_clips):
+    def _onPipelineProgress(self, stage, percent):
+        self._pipeline_progress[stage] = percent
+        self.progress_bar.setValue(min(self._pipeline_progress))
+
+    def onSceneDetectionFinished(self, success):
         self.progress_bar.hide()
-        success = self.backend.update_timeline_with_trimmed_clips(new_clips)
         if success:
             QMessageBox.information(self, "Scene Detection Complete", "Automatic trimming and scene detection completed successfully.")
         else:
@@ -702,14 +916,19 @@ class DroneVideoEditor(QMainWindow):
             idx_source = self.preview_widgets.index(source_widget)
             idx_target = self.preview_widgets.index(target_widget)
             self.preview_widgets[idx_source], self.preview_widgets[idx_target] = self.preview_widgets[idx_target], self.preview_widgets[idx_source]
-            for i in reversed(range(self.clip_layout.count())):
-                item = self.clip_layout.itemAt(i)
-                if item and item.widget():
-                    self.clip_layout.removeWidget(item.widget())
-            for idx, widget in enumerate(self.preview_widgets):
-                row = idx // 4
-                col = idx % 4
-                self.clip_layout.addWidget(widget, row, col)
+            # Only the two swapped cells move; the rest of the grid is left in place.
+            # Swap the cells the widgets actually occupy rather than deriving them from list indices
+            source_cell = self.clip_layout.getItemPosition(self.clip_layout.indexOf(source_widget))[:2]
+            target_cell = self.clip_layout.getItemPosition(self.clip_layout.indexOf(target_widget))[:2]
+            container = self.clip_layout.parentWidget()
+            container.setUpdatesEnabled(False)
+            try:
+                self.clip_layout.removeWidget(source_widget)
+                self.clip_layout.removeWidget(target_widget)
+                self.clip_layout.addWidget(source_widget, *target_cell)
+                self.clip_layout.addWidget(target_widget, *source_cell)
+            finally:
+                container.setUpdatesEnabled(True)
             logging.info("Clips reordered.")
         except Exception as e:
             logging.exception("Error reordering clips: %s", e)
@@ -717,8 +936,11 @@ class DroneVideoEditor(QMainWindow):
     def openSettings(self):
         dialog = SettingsDialog(self.settings, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.settings = dialog.getSettings()
-            logging.info("Settings updated: %s", self.settings)
+            settings = dialog.getSettings()
+            # Explicitly accepted, so these become the saved preferences and replace any project overrides
+            self._settings_store.update(settings)
+            self._project_settings = {}
+            logging.info("Settings updated: %s", settings)
 
     def saveProject(self):
         try:
@@ -750,33 +972,43 @@ class DroneVideoEditor(QMainWindow):
                     item = self.clip_layout.takeAt(0)
                     if item and item.widget():
                         item.widget().deleteLater()
-                for clip in project_data.get("clips", []):
-                    self.addClipPreview(clip)
-                self.settings = project_data.get("settings", self.settings)
+                self.addClipPreviews(project_data.get("clips", []))
+                self._project_settings = dict(project_data.get("settings", {}))
                 logging.info("Project loaded from %s.", file_path)
         except Exception as e:
             logging.exception("Error loading project: %s", e)
             QMessageBox.critical(self, "Load Error", "Failed to load the project.")
 
+    def _updateExportClipCount(self):
+        if self._export_dialog is not None:
+            self._export_dialog.setClipCount(len(self.preview_widgets))
+
     def exportVideo(self):
         dialog = ExportDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        self._export_dialog = dialog
+        try:
+            accepted = dialog.exec() == QDialog.DialogCode.Accepted
+        finally:
+            self._export_dialog = None
+        if accepted:
             export_settings = dialog.getExportSettings()
             logging.info("Export settings: %s", export_settings)
             self.progress_bar.show()
             self.progress_bar.setValue(0)
+            priority = (
+                QThread.Priority.LowPriority if export_settings.get("background_priority")
+                else QThread.Priority.InheritPriority
+            )
 
             if export_settings.get("batch_export"):
-                self.batchThread = QThread()
-                self.batchWorker = BatchExportWorker(len(self.preview_widgets))
-                self.batchWorker.moveToThread(self.batchThread)
-                self.batchThread.started.connect(self.batchWorker.run)
-                self.batchWorker.progress.connect(self.progress_bar.setValue)
-                self.batchWorker.finished.connect(self.batchThread.quit)
-                self.batchWorker.finished.connect(self.batchWorker.deleteLater)
-                self.batchThread.finished.connect(self.batchThread.deleteLater)
-                self.batchWorker.finished.connect(lambda: self.progress_bar.hide())
-                self.batchThread.start()
+                # One task per clip, run concurrently up to the "Parallel Exports" setting
+                self.batchPool = BatchExportPool(
+                    len(self.preview_widgets), export_settings.get("parallel_exports", 1), priority
+                )
+                self.batchPool.progress.connect(self.progress_bar.setValue)
+                self.batchPool.finished.connect(lambda: self.progress_bar.hide())
+                self.batchPool.finished.connect(self.batchPool.deleteLater)
+                self.batchPool.start()
             else:
                 self.exportThread = QThread()
                 self.exportWorker = ExportWorker()
@@ -787,7 +1019,18 @@ class DroneVideoEditor(QMainWindow):
                 self.exportWorker.finished.connect(self.exportWorker.deleteLater)
                 self.exportThread.finished.connect(self.exportThread.deleteLater)
                 self.exportWorker.finished.connect(lambda: self.progress_bar.hide())
-                self.exportThread.start()
+                self.exportThread.start(priority)
+
+    def addClipPreviews(self, file_paths):
+        """Add several previews with painting paused, so the grid is laid out once at the end."""
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        try:
+            for file_path in file_paths:
+                self.addClipPreview(file_path)
+        finally:
+            central.setUpdatesEnabled(True)
+            central.update()
 
     def addClipPreview(self, file_path):
         if self.plus_label.isVisible():
@@ -799,16 +1042,27 @@ class DroneVideoEditor(QMainWindow):
         self.clip_layout.addWidget(preview_widget, row, col)
         self.preview_widgets.append(preview_widget)
         self.clip_count += 1
-        # Optionally call the backend to import media:
-        self.backend.import_media([file_path])
+        self._updateExportClipCount()
 
     def removeClip(self, preview_widget):
         try:
             preview_widget.cleanup()
-            self.clip_layout.removeWidget(preview_widget)
-            self.preview_widgets.remove(preview_widget)
+            removed_index = self.preview_widgets.index(preview_widget)
+            container = self.clip_layout.parentWidget()
+            container.setUpdatesEnabled(False)
+            try:
+                self.clip_layout.removeWidget(preview_widget)
+                self.preview_widgets.remove(preview_widget)
+                # Close the gap so each preview's grid cell matches its list index again
+                for idx in range(removed_index, len(self.preview_widgets)):
+                    widget = self.preview_widgets[idx]
+                    self.clip_layout.removeWidget(widget)
+                    self.clip_layout.addWidget(widget, *divmod(idx, 4))
+            finally:
+                container.setUpdatesEnabled(True)
             preview_widget.deleteLater()
             self.clip_count -= 1
+            self._updateExportClipCount()
             logging.info("Removed a clip.")
         except Exception as e:
             logging.exception("Error removing clip: %s", e)
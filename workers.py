@@ -1,15 +1,21 @@
+import os
+import queue
 import random
 import logging
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QThreadPool, QRunnable
 
-class AIWorker(QObject):
+class _AIWorkerSignals(QObject):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
 
+class AIWorker(QRunnable):
+    """Run one AI operation on a shared pool thread; progress is reported through self.signals."""
+
     def __init__(self, operation, num_clips):
         super().__init__()
         self.operation = operation
         self.num_clips = num_clips
+        self.signals = _AIWorkerSignals()
 
     def run(self):
         try:
@@ -18,13 +24,13 @@ class AIWorker(QObject):
                 if i % 5 == 0:
                     delay_ms = int((0.005 * self.num_clips + random.random() * 0.005) * 1000)
                     QThread.msleep(delay_ms)
-                    self.progress.emit(i)
+                    self.signals.progress.emit(i)
                 else:
                     QThread.msleep(1)
         except Exception as e:
             logging.exception("Exception in AIWorker during '%s': %s", self.operation, e)
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
 
 class ExportWorker(QObject):
     progress = pyqtSignal(int)
@@ -45,43 +51,176 @@ class ExportWorker(QObject):
         finally:
             self.finished.emit()
 
-class BatchExportWorker(QObject):
+class _ClipExportSignals(QObject):
+    progress = pyqtSignal(int, int)  # (clip index, percent)
+    finished = pyqtSignal(int)  # clip index
+
+class ClipExportTask(QRunnable):
+    """Export one clip on a pool thread, reporting progress through shared signals."""
+
+    def __init__(self, index, signals, priority=QThread.Priority.InheritPriority):
+        super().__init__()
+        self.index = index
+        self.signals = signals
+        self.priority = priority
+
+    def run(self):
+        try:
+            if self.priority != QThread.Priority.InheritPriority:
+                # Pool threads are reused, so set the priority for every task that asks for one
+                QThread.currentThread().setPriority(self.priority)
+            for i in range(0, 101, 5):
+                delay_ms = int((0.005 + random.random() * 0.005) * 1000)
+                QThread.msleep(delay_ms)
+                self.signals.progress.emit(self.index, i)
+        except Exception as e:
+            logging.exception("Exception exporting clip %d: %s", self.index, e)
+        finally:
+            self.signals.finished.emit(self.index)
+
+class BatchExportPool(QObject):
+    """Export clips concurrently on a bounded thread pool and report their averaged progress."""
     progress = pyqtSignal(int)
     finished = pyqtSignal()
 
-    def __init__(self, num_exports):
+    def __init__(self, num_exports, max_parallel=1, priority=QThread.Priority.InheritPriority):
         super().__init__()
         self.num_exports = num_exports
+        self.priority = priority
+        # The pool size is the concurrency limit, so no separate semaphore is needed
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(os.cpu_count() or 1, max_parallel)))
+        self._percent = [0] * num_exports
+        self._remaining = num_exports
+        # Lives on the GUI thread, so emits from pool threads arrive as queued calls
+        self._signals = _ClipExportSignals(self)
+        self._signals.progress.connect(self._onClipProgress)
+        self._signals.finished.connect(self._onClipFinished)
+
+    def start(self):
+        if not self.num_exports:
+            self.finished.emit()
+            return
+        for index in range(self.num_exports):
+            self._pool.start(ClipExportTask(index, self._signals, self.priority))
+
+    def _onClipProgress(self, index, percent):
+        self._percent[index] = percent
+        self.progress.emit(sum(self._percent) // self.num_exports)
+
+    def _onClipFinished(self, index):
+        self._percent[index] = 100
+        self._remaining -= 1
+        if self._remaining == 0:
+            self.progress.emit(100)
+            self.finished.emit()
+
+class ImportSignals(QObject):
+    imported = pyqtSignal(list)  # new Media Pool items
+    failed = pyqtSignal(str)
+
+class ImportTask(QRunnable):
+    """Import a batch of files with one backend call on a pool thread."""
+
+    def __init__(self, backend, file_paths, signals):
+        super().__init__()
+        self.backend = backend
+        self.file_paths = file_paths
+        self.signals = signals
 
     def run(self):
         try:
-            total_steps = 100 * self.num_exports
-            for i in range(total_steps + 1):
-                if i % 5 == 0:
-                    delay_ms = int((0.005 + random.random() * 0.005) * 1000)
-                    QThread.msleep(delay_ms)
-                    self.progress.emit(int(i / total_steps * 100))
-                else:
-                    QThread.msleep(1)
+            new_items = self.backend.import_media(self.file_paths)
+            self.signals.imported.emit(list(new_items or []))
         except Exception as e:
-            logging.exception("Exception in BatchExportWorker: %s", e)
+            logging.exception("Exception importing %d file(s): %s", len(self.file_paths), e)
+            self.signals.failed.emit(str(e))
+
+class ImportProducerWorker(QObject):
+    """Import files one at a time, handing each new media item to a queue as it lands."""
+    progress = pyqtSignal(int)
+    imported = pyqtSignal(list)
+    finished = pyqtSignal()
+
+    def __init__(self, backend, file_paths, out_queue):
+        super().__init__()
+        self.backend = backend
+        self.file_paths = file_paths
+        self.out_queue = out_queue
+
+    def run(self):
+        try:
+            total_files = len(self.file_paths)
+            for done, file_path in enumerate(self.file_paths, 1):
+                new_items = self.backend.import_media(file_path)
+                if new_items:
+                    self.imported.emit(list(new_items))
+                    for item in new_items:
+                        self.out_queue.put(item)
+                self.progress.emit(int(done / total_files * 100))
+        except Exception as e:
+            logging.exception("Exception in ImportProducerWorker: %s", e)
         finally:
+            # Sentinel: tells the consumer no more items are coming
+            self.out_queue.put(None)
             self.finished.emit()
 
+class TimelineUpdateWorker(QObject):
+    """Rebuild the timeline in batches from segments taken off a None-terminated queue as they arrive."""
+    finished = pyqtSignal(bool)
+
+    def __init__(self, backend, segments):
+        super().__init__()
+        self.backend = backend
+        self.segments = segments
+        self._drained = False
+
+    def _iter_segments(self):
+        yield from iter(self.segments.get, None)
+        self._drained = True
+
+    def run(self):
+        success = False
+        try:
+            success = self.backend.update_timeline_with_trimmed_clips(self._iter_segments())
+        except Exception as e:
+            logging.exception("Exception in TimelineUpdateWorker: %s", e)
+        finally:
+            # If the update stopped early, keep taking segments so the producer never blocks on a full queue
+            if not self._drained:
+                for _ in iter(self.segments.get, None):
+                    pass
+            self.finished.emit(bool(success))
+
 class SceneDetectionWorker(QObject):
+    """Detect scenes and put each (item, start, end) segment on out_queue as soon as it is found."""
     progress = pyqtSignal(int)
-    finished = pyqtSignal(list)
+    finished = pyqtSignal()
 
-    def __init__(self, imported_items):
+    def __init__(self, imported_items, out_queue, total_items=None):
+        """imported_items is a list, or a queue.Queue fed until a None sentinel (then pass total_items)."""
         super().__init__()
         self.imported_items = imported_items
+        self.out_queue = out_queue
+        self.total_items = len(imported_items) if total_items is None else total_items
 
     def run(self):
-        new_clips = []
-        total_items = len(self.imported_items)
+        try:
+            self._detect()
+        finally:
+            # Sentinel: tells the timeline consumer no more segments are coming
+            self.out_queue.put(None)
+            self.finished.emit()
+
+    def _detect(self):
+        total_items = self.total_items or 1
         progress_counter = 0
 
-        for item in self.imported_items:
+        items = self.imported_items
+        if isinstance(items, queue.Queue):
+            items = iter(items.get, None)
+
+        for item in items:
             try:
                 # Check if item is None before attempting to access any methods
                 if item is None:
@@ -93,12 +232,12 @@ class SceneDetectionWorker(QObject):
                 # If it's a TimelineItem, we need to fetch its MediaPoolItem
                 # First check if the method exists before calling it
                 media_pool_item = None
-                if hasattr(item, "GetMediaPoolItem") and callable(item.GetMediaPoolItem):
+                if callable(getattr(item, "GetMediaPoolItem", None)):
                     # GetMediaPoolItem can return None if it's offline or unlinked
                     try:
                         media_pool_item = item.GetMediaPoolItem()
                     except Exception as e:
-                        logging.warning(f"Error calling GetMediaPoolItem: {e}")
+                        logging.warning("Error calling GetMediaPoolItem: %s", e)
                         media_pool_item = None
                     
                     if media_pool_item:
@@ -110,22 +249,19 @@ class SceneDetectionWorker(QObject):
                         continue
 
                 # Now item should be a MediaPoolItem. If not, skip it.
-                if not hasattr(item, "GetClipProperty") or not callable(item.GetClipProperty):
-                    logging.warning(f"Skipping invalid item in scene detection: {type(item)}")
+                if not callable(getattr(item, "GetClipProperty", None)):
+                    logging.warning("Skipping invalid item in scene detection: %s", type(item))
                     progress_counter += 1
                     self.progress.emit(int((progress_counter / total_items) * 100))
                     continue
 
-                # Get clip properties safely
+                # Get clip properties safely, all in one round-trip to Resolve
                 try:
-                    clip_name = (
-                        self.safe_get_clip_property(item, "File Path") or
-                        self.safe_get_clip_property(item, "Clip Name") or
-                        "Unknown"
-                    )
+                    props = self.safe_get_clip_properties(item)
+                    clip_name = props.get("File Path") or props.get("Clip Name") or "Unknown"
                     
                     # For demonstration, get actual duration if possible, otherwise use random
-                    duration = self.safe_get_clip_property(item, "Duration")
+                    duration = props.get("Duration")
                     if not duration or not isinstance(duration, (int, float)):
                         duration = random.randint(20, 60)
                     else:
@@ -141,7 +277,7 @@ class SceneDetectionWorker(QObject):
                             except:
                                 duration = random.randint(20, 60)
                 except Exception as e:
-                    logging.warning(f"Error getting clip properties: {e}")
+                    logging.warning("Error getting clip properties: %s", e)
                     clip_name = "Unknown"
                     duration = random.randint(20, 60)
 
@@ -155,9 +291,9 @@ class SceneDetectionWorker(QObject):
                     clip_name, duration, scene_changes
                 )
 
-                for i in range(len(scene_changes) - 1):
-                    start = scene_changes[i]
-                    end = scene_changes[i + 1]
+                # Computed once per source clip and reused by every segment's log record
+                clip_label = os.path.basename(clip_name)
+                for start, end in zip(scene_changes, scene_changes[1:]):
                     segment_duration = end - start
                     if segment_duration < 2:
                         logging.info("Skipping segment from %s to %s (duration %s sec) as too short.",
@@ -167,8 +303,8 @@ class SceneDetectionWorker(QObject):
                         logging.info("Skipping segment from %s to %s as dark/empty scene.", start, end)
                         continue
 
-                    new_clips.append((item, start, end))
-                    logging.info("Created subclip for '%s': %s to %s", clip_name, start, end)
+                    self.out_queue.put((item, start, end))
+                    logging.info("Created subclip for '%s': %s to %s", clip_label, start, end)
 
             except Exception as e:
                 logging.exception("Exception detecting scenes for clip: %s", e)
@@ -176,14 +312,12 @@ class SceneDetectionWorker(QObject):
             progress_counter += 1
             if progress_counter % 2 == 0 or progress_counter == total_items:
                 self.progress.emit(int((progress_counter / total_items) * 100))
-
-        self.finished.emit(new_clips)
     
-    def safe_get_clip_property(self, item, property_name):
-        """Safely get a clip property, handling exceptions."""
+    def safe_get_clip_properties(self, item):
+        """Safely get all clip properties as a dict, handling exceptions."""
+        # Callers in run() have already checked that item exposes GetClipProperty
         try:
-            if hasattr(item, "GetClipProperty") and callable(item.GetClipProperty):
-                return item.GetClipProperty(property_name)
+            return item.GetClipProperty() or {}
         except Exception as e:
-            logging.warning(f"Error getting clip property '{property_name}': {e}")
-        return None
\ No newline at end of file
+            logging.warning("Error getting clip properties: %s", e)
+        return {}
\ No newline at end of file